@@ -0,0 +1,129 @@
+"""Benchmark the trip history analytics against a plain Python loop.
+
+Writes synthetic trips to a temporary trip store and times
+analytics.summarize_store next to a loop over TripStore.query doing the
+same three groupings. Run from the repository root:
+
+    python benchmarks/bench_analytics.py [trips]
+"""
+
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+import types
+
+# Import the plain modules without the Home Assistant package __init__
+ROOT = Path(__file__).parents[1] / "custom_components"
+for name, path in (
+    ("custom_components", ROOT),
+    ("custom_components.my_fisker", ROOT / "my_fisker"),
+):
+    module = types.ModuleType(name)
+    module.__path__ = [str(path)]
+    sys.modules.setdefault(name, module)
+
+from custom_components.my_fisker.analytics import (
+    SPEED_BANDS,
+    TEMPERATURE_BANDS,
+    summarize_store,
+)
+from custom_components.my_fisker.tripstore import (
+    KIND_TRIP,
+    TripRecord,
+    TripStore,
+)
+
+REPEAT = 5
+
+
+def synthetic_trips(count: int) -> list[TripRecord]:
+    random.seed(1)
+    end = int(datetime(2023, 1, 1, tzinfo=timezone.utc).timestamp())
+    odometer = 0.0
+    trips = []
+    for _ in range(count):
+        distance = random.uniform(1, 120)
+        speed = random.uniform(10, 130)
+        start = end + random.randint(600, 6 * 3600)
+        end = start + int(distance / speed * 3600) + 1
+        battery = random.uniform(40, 100)
+        energy = distance * random.uniform(15, 28) / 100
+        trips.append(
+            TripRecord(
+                KIND_TRIP,
+                start,
+                end,
+                odometer,
+                odometer + distance,
+                battery,
+                battery - energy / 106 * 100,
+                energy,
+                energy / distance * 100,
+                random.uniform(-15, 35),
+                speed,
+            )
+        )
+        odometer += distance
+    return trips
+
+
+def summarize_loop(store: TripStore) -> dict:
+    """The same groupings as analytics.summarize, one trip at a time."""
+    groups = {
+        "by_temperature": defaultdict(lambda: [0, 0.0, 0.0]),
+        "by_speed": defaultdict(lambda: [0, 0.0, 0.0]),
+        "by_month": defaultdict(lambda: [0, 0.0, 0.0]),
+    }
+    temperature_bands = TEMPERATURE_BANDS.tolist()
+    speed_bands = SPEED_BANDS.tolist()
+    for trip in store.query(0, None, KIND_TRIP):
+        distance = trip.odometer_end - trip.odometer_start
+        month = datetime.fromtimestamp(trip.end, timezone.utc).strftime("%Y-%m")
+        for group, key in (
+            (
+                "by_temperature",
+                bisect_right(temperature_bands, trip.ambient_temperature),
+            ),
+            ("by_speed", bisect_right(speed_bands, trip.average_speed)),
+            ("by_month", month),
+        ):
+            bucket = groups[group][key]
+            bucket[0] += 1
+            bucket[1] += distance
+            bucket[2] += trip.energy
+    return groups
+
+
+def best_of(function, *args) -> float:
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        function(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as directory:
+        store = TripStore(str(Path(directory) / "trips.bin"), max_bytes=1 << 40)
+        for trip in synthetic_trips(count):
+            store.append(trip)
+        store.flush()
+        size = Path(store.path).stat().st_size
+
+        vectorized = best_of(summarize_store, store)
+        loop = best_of(summarize_loop, store)
+
+    print(f"{count} trips, {size / 1e6:.1f} MB, best of {REPEAT}")
+    print(f"summarize_store   {vectorized * 1000:8.1f} ms")
+    print(f"Python loop       {loop * 1000:8.1f} ms  ({loop / vectorized:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,9 @@ import asyncio.timeouts
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import logging
+import time
 
+import aiohttp
 import pytz
 
 from homeassistant.components.button import ButtonEntityDescription
@@ -19,22 +21,77 @@ from homeassistant.const import (
     CONF_USERNAME,
     Platform,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import STORAGE_DIR, Store
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
 )
 
-from .api import MyFiskerAPI
+from .analytics import summarize_store
+from .api import MyFiskerAPI, MyFiskerConnectionRegistry
+from .charging import ChargeRateEstimator
+from .commands import FiskerCommandQueue
 from .const import (
+    ACTIVE_SCAN_INTERVAL,
+    CAR_SETTINGS,
+    CHARGE_RATE_HALF_LIFE,
+    COMMAND_PREDICTIONS,
+    CONF_WS_HEARTBEAT,
+    CONF_WS_RECEIVE_TIMEOUT,
+    CONFIRM_SCAN_INTERVAL,
+    DATA_CONNECTIONS,
+    DATA_GEOFENCES,
+    DATA_SCHEDULER,
+    DEEP_IDLE_SCAN_INTERVAL,
     DEVICE_MANUCFACTURER,
     DEVICE_MODEL,
     DOMAIN,
+    EVENT_CHARGING_ENDED,
+    EVENT_CHARGING_STARTED,
+    EVENT_TRIP_ENDED,
+    EVENT_TRIP_STARTED,
+    EVENT_VEHICLE_STATE_CHANGED,
+    LOCKED_SCAN_INTERVAL,
+    PREDICTION_TIMEOUT,
+    PROFILES,
+    RANGE_MODEL_ALPHA,
+    RANGE_MODEL_MIN_DISTANCE,
+    RANGE_MODEL_MIN_TRIPS,
+    SIGNAL_COORDINATOR_UNLOADED,
+    STATS_SAVE_DELAY,
+    STATS_STORE_VERSION,
     TRIM_EXTREME_ULTRA_BATT_CAPACITY,
     TRIM_SPORT_BATT_CAPACITY,
+    TRIP_FLUSH_DELAY,
+    TRIP_STORE_MAX_BYTES,
+    TWIN_BATCH_MAX_AGE,
+    VEHICLE_STATE_DEBOUNCE,
+    WAKE_GRACE_PERIOD,
+    WS_HEARTBEAT_INTERVAL,
+    WS_RECEIVE_TIMEOUT,
+    ZONE_SCAN_INTERVAL,
+)
+from .geofence import FiskerGeofences
+from .rangemodel import RangePredictor
+from .scheduler import PRIORITY_ACTIVE, PRIORITY_IDLE, FiskerScheduler
+from .services import async_setup_services
+from .statemachine import (
+    STATE_ASLEEP,
+    STATE_CHARGING,
+    STATE_DRIVING,
+    STATE_PARKED,
+    Transition,
+    VehicleStateMachine,
 )
 from .stats import TripStats
+from .tripstore import KIND_CHARGE, KIND_TRIP, TripRecord, TripStore
+from .websocket_api import async_setup_websocket
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,6 +107,8 @@ async def async_setup(hass: HomeAssistant, config: dict):
     """Set up the My Fisker component."""
 
     hass.data[DOMAIN] = {}
+    async_setup_services(hass)
+    async_setup_websocket(hass)
     return True
 
 
@@ -59,39 +118,150 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
 
     data = entry.data
+
+    # Accounts in the same region share the HTTP connection pool
+    connections: MyFiskerConnectionRegistry = hass.data[DOMAIN].setdefault(
+        DATA_CONNECTIONS,
+        MyFiskerConnectionRegistry(
+            lambda: async_create_clientsession(
+                hass, cookie_jar=aiohttp.DummyCookieJar()
+            )
+        ),
+    )
+    session = connections.async_get_session(data[CONF_REGION], entry.entry_id)
+
+    # All coordinators of all accounts share the gateway session budget
+    scheduler: FiskerScheduler = hass.data[DOMAIN].setdefault(
+        DATA_SCHEDULER, FiskerScheduler()
+    )
+    # The vehicles of an account poll together, so one session serves them all
+    scheduler.async_register(entry.entry_id)
+
+    # Zones are indexed once for the whole fleet
+    if DATA_GEOFENCES not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][DATA_GEOFENCES] = FiskerGeofences(hass)
+    geofences: FiskerGeofences = hass.data[DOMAIN][DATA_GEOFENCES]
+
     myFiskerApi = MyFiskerAPI(
-        data[CONF_USERNAME], data[CONF_PASSWORD], data[CONF_REGION]
+        data[CONF_USERNAME],
+        data[CONF_PASSWORD],
+        data[CONF_REGION],
+        heartbeat=entry.options.get(CONF_WS_HEARTBEAT, WS_HEARTBEAT_INTERVAL),
+        receive_timeout=entry.options.get(CONF_WS_RECEIVE_TIMEOUT, WS_RECEIVE_TIMEOUT),
+        session=session,
     )
     await myFiskerApi.GetAuthTokenAsync()
 
+    # One coordinator and device per vehicle, all served by the same account connection
+    vins = await myFiskerApi.GetVins()
+    coordinators: dict[str, MyFiskerCoordinator] = {}
+    for vin in vins:
+        alias = data[CONF_ALIAS] if len(vins) == 1 else f"{data[CONF_ALIAS]} {vin[-6:]}"
+        coordinators[vin] = MyFiskerCoordinator(
+            hass, myFiskerApi, alias, vin, entry.entry_id, scheduler, geofences
+        )
+
     # Fetch initial data so we have data when entities subscribe
-    coordinator = MyFiskerCoordinator(hass, myFiskerApi, data[CONF_ALIAS])
-    await coordinator.async_config_entry_first_refresh()
+    await asyncio.gather(
+        *(
+            coordinator.async_config_entry_first_refresh()
+            for coordinator in coordinators.values()
+        )
+    )
 
     hass.data[DOMAIN][entry.entry_id] = HassMyFisker(
         entry.data[CONF_USERNAME],
         entry.data[CONF_PASSWORD],
         entry.data[CONF_ALIAS],
         entry.data[CONF_REGION],
-        coordinator,
+        myFiskerApi,
+        coordinators,
     )
 
     # Get the time difference between UTC and local time zone
     utc_time = datetime.now(pytz.utc)
     local_time = utc_time.astimezone(pytz.timezone(hass.config.time_zone))
-    coordinator.time_difference_from_utc = local_time.utcoffset()
+    for coordinator in coordinators.values():
+        coordinator.time_difference_from_utc = local_time.utcoffset()
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    await coordinator.async_refresh()
+    # Only fetch what enabled entities consume, re-evaluated when they change
+    my_Fisker_data = hass.data[DOMAIN][entry.entry_id]
+    async_update_demand(hass, entry, my_Fisker_data)
+
+    @callback
+    def _async_entity_registry_updated(event: Event) -> None:
+        if event.data["action"] == "update" and "disabled_by" not in event.data.get(
+            "changes", {}
+        ):
+            return
+        async_update_demand(hass, entry, my_Fisker_data)
+
+    entry.async_on_unload(
+        hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, _async_entity_registry_updated
+        )
+    )
+
+    # Deadband and connection options are read when the entry is set up
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
+    # Give the new entities their first state, an unchanged refresh would not
+    for coordinator in coordinators.values():
+        coordinator.async_update_listeners()
 
     return True
 
 
+@callback
+def async_update_demand(hass: HomeAssistant, entry: ConfigEntry, my_Fisker_data):
+    """Work out which handlers besides the digital twin enabled entities need."""
+    registry = er.async_get(hass)
+
+    # unique_id is f"{vin}_{key}"
+    keys = {
+        entity.unique_id.split("_", 1)[1]
+        for entity in er.async_entries_for_config_entry(registry, entry.entry_id)
+        if entity.disabled_by is None and "_" in entity.unique_id
+    }
+
+    demand = set()
+    if any(key.startswith("car_settings_") for key in keys):
+        demand.add(CAR_SETTINGS)
+    # The BLE key attribute of the vin sensor comes from the profiles
+    if "vin" in keys:
+        demand.add(PROFILES)
+
+    if demand != my_Fisker_data.api.demand:
+        _LOGGER.info("Fisker '%s' now fetching %s", entry.title, demand or "twin only")
+    my_Fisker_data.api.demand = demand
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        my_Fisker_data = hass.data[DOMAIN].pop(entry.entry_id)
+        hass.data[DOMAIN][DATA_SCHEDULER].async_unregister(entry.entry_id)
+        # The zone index is only kept while a vehicle is set up
+        if not any(
+            isinstance(value, HassMyFisker) for value in hass.data[DOMAIN].values()
+        ):
+            hass.data[DOMAIN].pop(DATA_GEOFENCES).async_close()
+        for coordinator in my_Fisker_data.coordinators.values():
+            async_dispatcher_send(hass, SIGNAL_COORDINATOR_UNLOADED, coordinator)
+            await coordinator.async_flush_trips()
+            # A reload loads the statistics right after this, not after a delayed save
+            await coordinator.async_save_stats()
+        await my_Fisker_data.api.async_close()
+        await hass.data[DOMAIN][DATA_CONNECTIONS].async_release(
+            entry.data[CONF_REGION], entry.entry_id
+        )
 
     return unload_ok
 
@@ -103,13 +273,15 @@ class HassMyFisker:
         password: str,
         alias: str,
         region: str,
-        coordinator: DataUpdateCoordinator,
+        api: MyFiskerAPI,
+        coordinators: dict[str, DataUpdateCoordinator],
     ):
         self._username = username
         self._password = password
         self._alias = alias
         self._region = region
-        self._coordinator = coordinator
+        self.api = api
+        self.coordinators = coordinators
 
         _LOGGER.debug(
             f"MyFisker __init__{self._username}:{self._alias}, region={self._region}"
@@ -125,7 +297,16 @@ class HassMyFisker:
 class MyFiskerCoordinator(DataUpdateCoordinator):
     """My Fisker coordinator."""
 
-    def __init__(self, hass, my_api: MyFiskerAPI, alias: str):
+    def __init__(
+        self,
+        hass,
+        my_api: MyFiskerAPI,
+        alias: str,
+        vin: str,
+        account: str,
+        scheduler: FiskerScheduler,
+        geofences: FiskerGeofences,
+    ):
         """Initialize my coordinator."""
         super().__init__(
             hass,
@@ -134,42 +315,444 @@ class MyFiskerCoordinator(DataUpdateCoordinator):
             name=f"MyFisker coordinator for '{alias}'",
             # Polling interval. Will only be polled if there are subscribers.
             update_interval=timedelta(seconds=30),
+            # Unchanged snapshots are not fanned out to the entities
+            always_update=False,
         )
         self._hass = hass
         self._previous_update_interval = self.update_interval
 
         self.my_fisker_api = my_api
         self.alias = alias
+        self.vin = vin
+        # Polls are spread per account, see FiskerScheduler.next_poll
+        self.account = account
+        self._scheduler = scheduler
+        self._geofences = geofences
+        # Zones the vehicle is in or approaching
+        self.zones: frozenset[str] = frozenset()
+        self.command_queue = FiskerCommandQueue(self)
+        # Snapshot keys split into platforms, see catalog.partition_snapshot
+        self.entity_partition = None
+        self._predictions: dict = {}
+        self._prediction_deadline = 0.0
         self.time_difference_from_utc = None
         self.tripstats: TripStats = TripStats()
         self.chargestats: TripStats = TripStats()
+        self._wake_until = 0.0
+        self.trip_store = TripStore(
+            hass.config.path(STORAGE_DIR, DOMAIN, f"trips_{vin}.bin"),
+            TRIP_STORE_MAX_BYTES,
+        )
+        self.state_machine = VehicleStateMachine(VEHICLE_STATE_DEBOUNCE)
+        self._trip_start = None
+        self._charge_start = None
+        self.charge_rate = ChargeRateEstimator(CHARGE_RATE_HALF_LIFE)
+        self.range_model = RangePredictor(RANGE_MODEL_ALPHA, RANGE_MODEL_MIN_TRIPS)
+        self._flush_unsub = None
+        # Trip and charge statistics survive a restart
+        self._stats_store = Store(hass, STATS_STORE_VERSION, f"{DOMAIN}.stats_{vin}")
+        self._stats_save_pending = False
+        # Summary of the trip history, see analytics.summarize
+        self.analytics: dict | None = None
+        self.last_fetched = 0.0
+
+    @property
+    def battery_capacity(self):
+        # VCF1Z = One, VCF1E = Extreme, VCF1U = Ultra VCF1S = Sport
+        trim_extreme_ultra = ["VCF1Z", "VCF1E", "VCF1U"]
+        trim_sport = ["VCF1S"]
+        if self.vin[0:5] in trim_extreme_ultra:
+            return TRIM_EXTREME_ULTRA_BATT_CAPACITY
+        if self.vin[0:5] in trim_sport:
+            return TRIM_SPORT_BATT_CAPACITY
+        else:
+            return 0
+
+    async def _async_setup(self):
+        """Restore the trip and charge statistics saved before a restart."""
+        try:
+            stored = await self._stats_store.async_load()
+            if stored:
+                self.tripstats.restore(stored["tripstats"])
+                self.chargestats.restore(stored["chargestats"])
+                self._trip_start = stored["trip_start"]
+                self._charge_start = stored["charge_start"]
+                # Picks up where it was, what happened meanwhile shows as transitions
+                self.state_machine.state = stored.get("vehicle_state")
+
+            if stored and "range_model" in stored:
+                self.range_model.restore(stored["range_model"])
+            else:
+                # First start, learn from the trips recorded so far
+                for record in await self._hass.async_add_executor_job(
+                    self.trip_store.query, 0, None, KIND_TRIP
+                ):
+                    self._learn_range(record)
+        except Exception as ex:
+            _LOGGER.warning("Fisker '%s' statistics not restored: %s", self.alias, ex)
+
+        await self.async_update_analytics()
+
+    async def async_save_stats(self):
+        """Write the statistics now, e.g. before the entry is reloaded."""
+        await self._stats_store.async_save(self._stats_data())
+
+    async def async_update_analytics(self):
+        """Summarize the trip history again."""
+        try:
+            self.analytics = await self._hass.async_add_executor_job(
+                summarize_store, self.trip_store
+            )
+        except Exception as ex:
+            _LOGGER.warning("Fisker '%s' trip analytics failed: %s", self.alias, ex)
+
+    def _stats_data(self) -> dict:
+        # Called by the store when it writes
+        self._stats_save_pending = False
+        return {
+            "tripstats": self.tripstats.as_dict(),
+            "chargestats": self.chargestats.as_dict(),
+            "trip_start": self._trip_start,
+            "charge_start": self._charge_start,
+            "vehicle_state": self.state_machine.state,
+            "range_model": self.range_model.as_dict(),
+        }
+
+    @property
+    def data_age(self) -> float:
+        """Return the seconds since the digital twin was last fetched."""
+        return time.monotonic() - self.last_fetched
+
+    @property
+    def predicted_range(self) -> int | None:
+        """Return the range predicted from past trips, in km."""
+        if self.data is None:
+            return None
+        return self.range_model.predict(
+            self.data.battery_state_of_charge,
+            self.battery_capacity,
+            self.data.climate_control_ambient_temperature,
+            # Speed only tells something while driving
+            self.data.vehicle_speed_speed
+            if self.state_machine.state == STATE_DRIVING
+            else None,
+        )
+
+    def is_asleep(self, data) -> bool:
+        """Return True when the snapshot reports the vehicle offline or sleeping."""
+        if data is None:
+            return False
+        return data.online is False and data.online_hmi is False
+
+    def async_wake(self):
+        """Leave deep-idle mode, e.g. because a command was issued."""
+        self._wake_until = time.monotonic() + WAKE_GRACE_PERIOD
+        # update_interval is the delay to the next slot, compare the cadence
+        if self._previous_update_interval != timedelta(seconds=ACTIVE_SCAN_INTERVAL):
+            _LOGGER.info("Fisker '%s' woken, resuming normal refresh rate", self.alias)
+            self.update_interval = timedelta(seconds=ACTIVE_SCAN_INTERVAL)
+
+    @property
+    def priority(self) -> int:
+        """Return the scheduling priority, driving or charging vehicles come first."""
+        if self.data is None:
+            return PRIORITY_IDLE
+        if self.data.gear_in_park is False or "charging" in str(
+            self.data.battery_charge_type
+        ):
+            return PRIORITY_ACTIVE
+        return PRIORITY_IDLE
+
+    def async_apply_prediction(self, command: str):
+        """Show the values a command is expected to produce right away."""
+        predicted = COMMAND_PREDICTIONS.get(command)
+        if not predicted or self.data is None:
+            return
+
+        self._predictions.update(predicted)
+        self._prediction_deadline = time.monotonic() + PREDICTION_TIMEOUT
+
+        # Poll fast until the car confirms the prediction
+        self.update_interval = timedelta(seconds=CONFIRM_SCAN_INTERVAL)
+        self.async_set_updated_data(self.data.replace(predicted))
+
+    def async_discard_prediction(self, command: str):
+        """Forget the prediction of a command that failed, the next refresh rolls it back."""
+        for key in COMMAND_PREDICTIONS.get(command, {}):
+            self._predictions.pop(key, None)
+
+    def _merge_predictions(self, data):
+        if not self._predictions:
+            return data
+
+        if time.monotonic() > self._prediction_deadline:
+            _LOGGER.warning(
+                "Fisker '%s' did not confirm %s, rolling back",
+                self.alias,
+                self._predictions,
+            )
+            self._predictions = {}
+            return data
+
+        # Keys the car now reports as predicted are confirmed
+        for key, value in list(self._predictions.items()):
+            if data.get(key) == value:
+                del self._predictions[key]
+
+        return data.replace(self._predictions) if self._predictions else data
+
+    def _update_zones(self, data):
+        zones = self._geofences.lookup(data.location_latitude, data.location_longitude)
+        if zones != self.zones:
+            for zone in zones - self.zones:
+                _LOGGER.debug("Fisker '%s' approaching %s", self.alias, zone)
+            for zone in self.zones - zones:
+                _LOGGER.debug("Fisker '%s' left %s", self.alias, zone)
+            self.zones = zones
+
+    @staticmethod
+    def _session_point(since: float, data):
+        return (
+            int(since),
+            data.battery_total_mileage_odometer,
+            data.battery_percent,
+            data.climate_control_ambient_temperature,
+        )
+
+    def _observed_state(self, data) -> str:
+        if self.is_asleep(data):
+            return STATE_ASLEEP
+        if "charging" in str(data.battery_charge_type):
+            return STATE_CHARGING
+        if data.gear_in_park is False:
+            return STATE_DRIVING
+        return STATE_PARKED
+
+    def _update_state(self, data) -> Transition | None:
+        """Move the vehicle state, and keep trips and charge sessions in step with it."""
+        transition = self.state_machine.update(
+            self._observed_state(data), time.time(), data
+        )
+        if transition is not None:
+            self._handle_transition(transition)
+        state = self.state_machine.state
+
+        odometer = data.battery_total_mileage_odometer
+        battery = data.battery_percent
+        if state == STATE_DRIVING:
+            self.tripstats.add_sample(odometer, battery)
+        if state == STATE_CHARGING:
+            if battery is not None:
+                self.charge_rate.add(time.time(), battery)
+        else:
+            # Charge stats cover everything since the last charge
+            self.chargestats.add_sample(odometer, battery)
+        self.chargestats.carIsRunning = state != STATE_CHARGING
+        self.chargestats.vehicleParked = state != STATE_DRIVING
+        return transition
+
+    def _handle_transition(self, transition: Transition):
+        previous, state, since, data = transition
+        odometer = data.battery_total_mileage_odometer
+        battery = data.battery_percent
+        point = self._session_point(since, data)
+        record = None
+
+        if previous == STATE_DRIVING:
+            self.tripstats.add_sample(odometer, battery)
+            self.tripstats.vehicleParked = True
+            if self._trip_start is not None:
+                record = self._finish_session(KIND_TRIP, self._trip_start, point)
+                self._trip_start = None
+        elif previous == STATE_CHARGING:
+            if self._charge_start is not None:
+                record = self._finish_session(KIND_CHARGE, self._charge_start, point)
+                self._charge_start = None
+            self.chargestats.Clear()
+
+        if state == STATE_DRIVING:
+            self.tripstats.Clear()
+            self.tripstats.vehicleParked = False
+            self.tripstats.add_sample(odometer, battery)
+            self._trip_start = point
+        elif state == STATE_CHARGING:
+            self._charge_start = point
+            self.charge_rate.reset()
+
+        # A session that starts or ends is saved right away
+        if {previous, state} & {STATE_DRIVING, STATE_CHARGING}:
+            self._stats_store.async_delay_save(self._stats_data)
+
+        # The first state after setting up is no change
+        if previous is None:
+            return
+
+        _LOGGER.info("Fisker '%s' %s -> %s", self.alias, previous, state)
+        event_data = {
+            "vin": self.vin,
+            "alias": self.alias,
+            "from_state": previous,
+            "to_state": state,
+        }
+        self._hass.bus.async_fire(EVENT_VEHICLE_STATE_CHANGED, event_data)
+
+        session = record.as_dict() if record is not None else {}
+        if previous == STATE_DRIVING:
+            self._hass.bus.async_fire(EVENT_TRIP_ENDED, {**event_data, **session})
+        elif previous == STATE_CHARGING:
+            self._hass.bus.async_fire(EVENT_CHARGING_ENDED, {**event_data, **session})
+        if state == STATE_DRIVING:
+            self._hass.bus.async_fire(EVENT_TRIP_STARTED, event_data)
+        elif state == STATE_CHARGING:
+            self._hass.bus.async_fire(EVENT_CHARGING_STARTED, event_data)
+
+    def _finish_session(self, kind: int, start, end) -> TripRecord | None:
+        """Append a finished trip or charge session to the trip store."""
+        if None in start[1:3] or None in end[1:3]:
+            return None
+
+        duration = end[0] - start[0]
+        distance = end[1] - start[1]
+        if kind == KIND_TRIP:
+            if distance <= 0:
+                return None
+            energy = max(start[2] - end[2], 0) * self.battery_capacity / 100
+            efficiency = energy / distance * 100
+        else:
+            energy = max(end[2] - start[2], 0) * self.battery_capacity / 100
+            efficiency = 0
+        ambient = [t for t in (start[3], end[3]) if t is not None]
+
+        record = TripRecord(
+            kind,
+            start[0],
+            end[0],
+            start[1],
+            end[1],
+            start[2],
+            end[2],
+            energy,
+            efficiency,
+            sum(ambient) / len(ambient) if ambient else 0,
+            distance / (duration / 3600) if duration > 0 else 0,
+        )
+        self.trip_store.append(record)
+        if kind == KIND_TRIP:
+            self._learn_range(record)
+
+        # Batch the writes, a day of driving is written in a few go's
+        if self._flush_unsub is None:
+            self._flush_unsub = async_call_later(
+                self._hass, TRIP_FLUSH_DELAY, self.async_flush_trips
+            )
+        return record
+
+    def _learn_range(self, record: TripRecord):
+        # Short trips are mostly warming up the cabin, not worth learning from
+        if (
+            record.odometer_end - record.odometer_start >= RANGE_MODEL_MIN_DISTANCE
+            and record.efficiency > 0
+        ):
+            self.range_model.add(
+                record.efficiency, record.ambient_temperature, record.average_speed
+            )
+
+    async def async_flush_trips(self, _now=None):
+        """Write the buffered trips to disk and the long-term statistics."""
+        if self._flush_unsub is not None:
+            self._flush_unsub()
+            self._flush_unsub = None
+        if not self.trip_store.pending:
+            return
+        records = await self._hass.async_add_executor_job(self.trip_store.flush)
+
+        # The same batch goes into the long-term statistics, when they are kept
+        if "recorder" in self._hass.config.components:
+            from .longterm import async_import_statistics
+
+            try:
+                await async_import_statistics(self._hass, self.vin, self.alias, records)
+            except Exception as ex:
+                _LOGGER.warning(
+                    "Fisker '%s' statistics import failed: %s", self.alias, ex
+                )
+
+        await self.async_update_analytics()
+
+    def _get_update_interval(self, data) -> timedelta:
+        # Prediction waiting for confirmation
+        if self._predictions:
+            return timedelta(seconds=CONFIRM_SCAN_INTERVAL)
+
+        # Vehicle asleep or offline, only probe now and then until it wakes up.
+        # A command may be waking it, keep the normal rate for a while after one.
+        if self.is_asleep(data) and time.monotonic() >= self._wake_until:
+            return timedelta(seconds=DEEP_IDLE_SCAN_INTERVAL)
+
+        # Driving near a zone, poll fast to catch the arrival
+        if self.zones and data.gear_in_park is False:
+            return timedelta(seconds=ZONE_SCAN_INTERVAL)
+
+        # Dynamic refresh rate, based on door lock status
+        if data.door_locks_driver is True:
+            return timedelta(seconds=LOCKED_SCAN_INTERVAL)
+
+        return timedelta(seconds=ACTIVE_SCAN_INTERVAL)
 
     async def _async_update_data(self):
         # Fetch data from API endpoint. This is the place to pre-process the data to lookup tables so entities can quickly look up their data.
         try:
-            async with asyncio.timeout(30):
+            # Waiting for a free session does not count towards the timeout
+            async with self._scheduler.session(self.priority), asyncio.timeout(30):
                 await self.my_fisker_api.GetAuthTokenAsync()
-                retData = await self.my_fisker_api.GetDigitalTwin()
-                await self.my_fisker_api.GetCarSettings()
-                await self.my_fisker_api.GetProfiles()
+                retData = await self.my_fisker_api.GetDigitalTwin(self.vin)
+                self.last_fetched = time.monotonic()
+
+                # A sleeping car does not change its settings, a deep-idle
+                # probe only needs the digital twin. Profiles come with the twin.
+                if CAR_SETTINGS in self.my_fisker_api.demand and (
+                    not self.is_asleep(retData) or self.data is None
+                ):
+                    await self.my_fisker_api.GetCarSettings(
+                        self.vin, max_age=TWIN_BATCH_MAX_AGE
+                    )
 
-                self._previous_update_interval = self.update_interval
+                retData = self._merge_predictions(retData)
+                self._update_zones(retData)
+                transition = self._update_state(retData)
 
-                # Dynamic refresh rate, based on door lock status
-                if retData.get("door_locks_driver") is True:
-                    self.update_interval = timedelta(seconds=60)
-                else:
-                    self.update_interval = timedelta(seconds=20)
+                # Checkpoint at a fixed pace, every further delayed save would
+                # push it back and it would never be written while polling
+                if not self._stats_save_pending:
+                    self._stats_save_pending = True
+                    self._stats_store.async_delay_save(
+                        self._stats_data, STATS_SAVE_DELAY
+                    )
+
+                update_interval = self._get_update_interval(retData)
 
                 # Log only if the update interval has changed
-                if self.update_interval != self._previous_update_interval:
+                if update_interval != self._previous_update_interval:
                     _LOGGER.info(
                         "Fisker refresh rate changed from %s to %s",
                         self._previous_update_interval,
-                        self.update_interval,
+                        update_interval,
                     )
-                    # Trigger an immediate refresh to apply the new interval
-                    await self.async_refresh()
+                self._previous_update_interval = update_interval
+
+                # The new interval is picked up when the next refresh is
+                # scheduled, on the account's slot in the fleet
+                self.update_interval = self._scheduler.next_poll(
+                    self.account, update_interval
+                )
+                self.my_fisker_api.SetNextPoll(
+                    self.vin, self.update_interval.total_seconds()
+                )
+
+                # A state is often confirmed on a snapshot equal to the last
+                # one, the coordinator would not tell the entities about it
+                if transition is not None and retData == self.data:
+                    self.async_update_listeners()
 
                 return retData
         except Exception as ex:
@@ -222,7 +805,14 @@ class FiskerButtonEntityDescription(ButtonEntityDescription):
     """Describes MyFisker ID button entity."""
 
     def __init__(
-        self, key, name, translation_key, icon, command: str, command_data: str = None
+        self,
+        key,
+        name,
+        translation_key,
+        icon,
+        command: str,
+        command_data: str = None,
+        command_group: str = None,
     ):
         super().__init__(key)
         self.key = key
@@ -231,6 +821,8 @@ class FiskerButtonEntityDescription(ButtonEntityDescription):
         self.icon = icon
         self.command = command
         self.command_data = command_data
+        # Commands in the same group supersede each other when queued
+        self.command_group = command_group or command
 
 
 @dataclass
@@ -246,6 +838,8 @@ class FiskerSensorEntityDescription(SensorEntityDescription):
         native_unit_of_measurement,
         value,
         format=None,
+        precision: int = None,
+        deadband: float = None,
     ):
         super().__init__(key)
         self.key = key
@@ -256,6 +850,21 @@ class FiskerSensorEntityDescription(SensorEntityDescription):
         self.native_unit_of_measurement = native_unit_of_measurement
         self.value = value
         self.format = format
+        # Values are rounded to precision decimals, and only written when they
+        # moved at least deadband away from the last written state
+        self.precision = precision
+        self.deadband = deadband
+
+    def quantize(self, value):
+        if (
+            self.precision is None
+            or isinstance(value, bool)
+            or not isinstance(value, (int, float))
+        ):
+            return value
+        if self.precision == 0:
+            return round(value)
+        return round(value, self.precision)
 
     def get_digital_twin_value(self, data):
         return self.value(data, self.key)
@@ -0,0 +1,133 @@
+"""Vectorized analytics over the trip history."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .tripstore import KIND_TRIP, RECORD, TripStore
+
+# Same layout as tripstore.RECORD, so the files load without unpacking
+TRIP_DTYPE = np.dtype(
+    [
+        ("kind", "u1"),
+        ("pad", "V3"),
+        ("start", "<u4"),
+        ("end", "<u4"),
+        ("odometer_start", "<f4"),
+        ("odometer_end", "<f4"),
+        ("battery_start", "<f4"),
+        ("battery_end", "<f4"),
+        ("energy", "<f4"),
+        ("efficiency", "<f4"),
+        ("ambient_temperature", "<f4"),
+        ("average_speed", "<f4"),
+    ]
+)
+assert TRIP_DTYPE.itemsize == RECORD.size
+
+# Bucket edges: ambient temperature in °C and average speed in km/h
+TEMPERATURE_BANDS = np.arange(-20, 45, 5)
+SPEED_BANDS = np.array([0, 30, 50, 70, 90, 110, 130])
+
+
+def load_trips(store: TripStore) -> np.ndarray:
+    """Return all trips of a trip store as one structured array, oldest first."""
+    parts = []
+    for path in (store.path + ".1", store.path):
+        try:
+            parts.append(np.fromfile(path, dtype=TRIP_DTYPE))
+        except FileNotFoundError:
+            continue
+    if not parts:
+        return np.empty(0, dtype=TRIP_DTYPE)
+    records = np.concatenate(parts)
+    return records[records["kind"] == KIND_TRIP]
+
+
+def _buckets(index: np.ndarray, labels: list, distance, energy) -> list[dict]:
+    """Distance weighted efficiency per bucket, empty buckets left out."""
+    size = len(labels)
+    count = np.bincount(index, minlength=size)
+    total_distance = np.bincount(index, weights=distance, minlength=size)
+    total_energy = np.bincount(index, weights=energy, minlength=size)
+
+    result = []
+    for i in np.flatnonzero(count):
+        result.append(
+            {
+                "bucket": labels[i],
+                "trips": int(count[i]),
+                "distance": round(float(total_distance[i]), 1),
+                "energy": round(float(total_energy[i]), 2),
+                "efficiency": round(float(total_energy[i] / total_distance[i] * 100), 2)
+                if total_distance[i] > 0
+                else None,
+            }
+        )
+    return result
+
+
+def _band_labels(edges: np.ndarray) -> list[str]:
+    labels = [f"<{edges[0]}"]
+    labels += [f"{low} to {high}" for low, high in zip(edges[:-1], edges[1:])]
+    labels.append(f">={edges[-1]}")
+    return labels
+
+
+def summarize(trips: np.ndarray) -> dict:
+    """Aggregate trips by ambient temperature, average speed and month.
+
+    Efficiency is kWh/100km over the total distance of a bucket, so a short
+    trip does not weigh as much as a long one.
+    """
+    distance = (trips["odometer_end"] - trips["odometer_start"]).astype(np.float64)
+    energy = trips["energy"].astype(np.float64)
+    total_distance = float(distance.sum())
+    total_energy = float(energy.sum())
+
+    months, month_index = np.unique(
+        trips["end"].astype("datetime64[s]").astype("datetime64[M]"),
+        return_inverse=True,
+    )
+
+    return {
+        "trips": int(trips.size),
+        "distance": round(total_distance, 1),
+        "energy": round(total_energy, 2),
+        "efficiency": round(total_energy / total_distance * 100, 2)
+        if total_distance > 0
+        else None,
+        "by_temperature": _buckets(
+            np.digitize(trips["ambient_temperature"], TEMPERATURE_BANDS),
+            _band_labels(TEMPERATURE_BANDS),
+            distance,
+            energy,
+        ),
+        "by_speed": _buckets(
+            np.digitize(trips["average_speed"], SPEED_BANDS),
+            _band_labels(SPEED_BANDS),
+            distance,
+            energy,
+        ),
+        "by_month": _buckets(
+            month_index.ravel(), [str(month) for month in months], distance, energy
+        ),
+    }
+
+
+def efficiency_at(summary: dict, temperature: float) -> float | None:
+    """Return the historical efficiency of the temperature band of temperature."""
+    if summary is None or temperature is None:
+        return None
+    label = _band_labels(TEMPERATURE_BANDS)[
+        int(np.digitize(temperature, TEMPERATURE_BANDS))
+    ]
+    for bucket in summary["by_temperature"]:
+        if bucket["bucket"] == label:
+            return bucket["efficiency"]
+    return None
+
+
+def summarize_store(store: TripStore) -> dict:
+    """Load and summarize the trip history, blocks, call it from the executor."""
+    return summarize(load_trips(store))
@@ -1,5 +1,10 @@
 """Class to handle connections towards Fisker API servers."""
 
+import asyncio
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+import hashlib
 import json
 import logging
 import time
@@ -9,37 +14,113 @@ import aiohttp
 from .const import (
     API_TIMEOUT,
     CAR_SETTINGS,
+    COMMAND_TIMEOUT,
     DIGITAL_TWIN,
+    HANDLER_COMMAND,
+    LIVE_SOCKET_IDLE_TIMEOUT,
     PROFILES,
+    RATE_LIMIT_AUTH,
+    RATE_LIMIT_COMMAND,
+    RATE_LIMIT_DATA,
     TRIM_EXTREME_ULTRA_BATT_CAPACITY,
     TRIM_SPORT_BATT_CAPACITY,
+    TWIN_BATCH_MAX_AGE,
     URL_TOKEN,
     URL_TOKEN_REFRESH,
     URL_WSS_EU,
     URL_WSS_US,
+    WS_HEARTBEAT_INTERVAL,
+    WS_RECEIVE_TIMEOUT,
+    WS_RECONNECT_ATTEMPTS,
 )
+from .ratelimit import TokenBucket
+from .snapshot import DigitalTwinSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
 headers = {"User-Agent": "MOBILE 1.0.0.0"}
 
-HasAUTH = False
-HasVIN = False
 
+def _frame_digest(response: str) -> bytes:
+    """Return the digest a raw frame is recognised by."""
+    return hashlib.blake2b(response.encode(), digest_size=16).digest()
 
-class MyFiskerAPI:
-    """Handle connection towards Fisker API servers."""
 
-    # Global variable to store the WebSocket connection
-    global_websocket = None
+class MyFiskerConnectionRegistry:
+    """Share one HTTP connection pool per region between all accounts.
+
+    Only the pool is shared, tokens and VINs stay on each MyFiskerAPI instance.
+    """
+
+    def __init__(self, session_factory: Callable[[], aiohttp.ClientSession]):
+        self._session_factory = session_factory
+        self._sessions: dict[str, aiohttp.ClientSession] = {}
+        self._accounts: dict[str, list[str]] = {}
+
+    def async_get_session(self, region: str, account: str) -> aiohttp.ClientSession:
+        """Register an account and return the session of its region."""
+        accounts = self._accounts.setdefault(region, [])
+        if account not in accounts:
+            accounts.append(account)
+
+        if region not in self._sessions or self._sessions[region].closed:
+            self._sessions[region] = self._session_factory()
+        return self._sessions[region]
 
-    vin = ""
+    async def async_release(self, region: str, account: str):
+        """Unregister an account, closing the region's session when it was the last one."""
+        accounts = self._accounts.get(region, [])
+        if account in accounts:
+            accounts.remove(account)
 
-    def __init__(self, username: str, password: str, region: str):
+        if not accounts and region in self._sessions:
+            await self._sessions.pop(region).close()
+
+
+@dataclass
+class CommandResult:
+    """Outcome of a remote command."""
+
+    command: str
+    success: bool
+    # True when the gateway acknowledged the command itself, False when only
+    # a fresh digital twin arrived after it was sent
+    confirmed: bool = False
+    # True when a later command of the same group replaced it before it was sent
+    superseded: bool = False
+    message: str = ""
+
+
+class MyFiskerAPI:
+    """Handle connection towards Fisker API servers."""
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        region: str,
+        heartbeat: float = WS_HEARTBEAT_INTERVAL,
+        receive_timeout: float = WS_RECEIVE_TIMEOUT,
+        session: aiohttp.ClientSession | None = None,
+    ):
         _LOGGER.debug("MyFiskerAPI init")
         self._username = username
         self._password = password
         self._region = region
+        self._heartbeat = heartbeat
+        self._receive_timeout = receive_timeout
+
+        # Shared per-region session, or None to use a short-lived session per request
+        self._session = session
+
+        # Live WebSocket connection of this account, used for remote commands
+        self._websocket: aiohttp.ClientWebSocketResponse | None = None
+        self._websocket_session: aiohttp.ClientSession | None = None
+        self._websocket_reader: asyncio.Task | None = None
+        self._websocket_lock = asyncio.Lock()
+        self._command_lock = asyncio.Lock()
+        self._pending_command: tuple[str, str, asyncio.Future] | None = None
+        self._last_command = 0.0
 
         self._accessToken = ""
         self._tokenExpiration = 0
@@ -47,9 +128,54 @@ class MyFiskerAPI:
         self._timeout = aiohttp.ClientTimeout(total=API_TIMEOUT)
         self.data = {}
 
+        # All vehicles on the account, and the raw profiles they came from
+        self.vin = ""
+        self.vins: list[str] = []
+        self.profiles: list[dict] = []
+
+        # Handlers consumed by enabled entities, besides the digital twin
+        self.demand: set[str] = {CAR_SETTINGS, PROFILES}
+
+        # Digital twin frames fetched in one session, waiting for their coordinator.
+        # Each holds its digest and the decoded message, None when unchanged.
+        self._twin_frames: dict[str, tuple[float, bytes, dict | None]] = {}
+        # Monotonic time each vehicle is polled next, see SetNextPoll
+        self._twin_due: dict[str, float] = {}
+        self._twin_lock = asyncio.Lock()
+        self._twin_digests: dict[str, tuple[bytes, DigitalTwinSnapshot]] = {}
+        self._twin_digest_vins: dict[bytes, str] = {}
+        self.skipped_frames = 0
+
+        # Car settings frame of each vehicle, with its "data" list of settings
+        self.car_settings: dict[str, dict] = {}
+        self._car_settings_received: dict[str, float] = {}
+
+        # Rate limiting per endpoint class, concurrent logins are coalesced
+        self._auth_limiter = TokenBucket("auth", *RATE_LIMIT_AUTH)
+        self._data_limiter = TokenBucket("data", *RATE_LIMIT_DATA)
+        self._command_limiter = TokenBucket("command", *RATE_LIMIT_COMMAND)
+        self._auth_lock = asyncio.Lock()
+
+    @property
+    def rate_limit_stats(self) -> dict:
+        """Return how often requests were throttled, per endpoint class."""
+        return {
+            limiter.name: limiter.as_dict()
+            for limiter in (
+                self._auth_limiter,
+                self._data_limiter,
+                self._command_limiter,
+            )
+        }
+
     async def GetAuthTokenAsync(self):
         """Get the Authentification token from Fisker, is used towards the WebSocket connection."""
 
+        # Callers arriving during a login wait for it and reuse its token
+        async with self._auth_lock:
+            return await self.__GetAuthTokenAsync()
+
+    async def __GetAuthTokenAsync(self):
         if self._accessToken != "":
             # Get the current timestamp in seconds (Unix timestamp)
             current_timestamp = int(time.time()) / 60
@@ -71,8 +197,9 @@ class MyFiskerAPI:
         _LOGGER.warning("Token empty or expired.")
 
         params = {"username": self._username, "password": self._password}
+        await self._auth_limiter.acquire()
         async with (
-            aiohttp.ClientSession() as session,
+            self.__Session() as session,
             session.post(URL_TOKEN, data=params) as response,
         ):
             data = await response.json()
@@ -101,8 +228,9 @@ class MyFiskerAPI:
         }
         params = {"refresh_token": refreshToken}
 
+        await self._auth_limiter.acquire()
         async with (
-            aiohttp.ClientSession() as session,
+            self.__Session() as session,
             session.post(URL_TOKEN_REFRESH, headers=headers, json=params) as response,
         ):
             data = await response.json()
@@ -125,30 +253,115 @@ class MyFiskerAPI:
     async def tokenReturn(self):
         return self._accessToken
 
-    async def GetCarSettings(self):
-        res = await self.__GetWebsocketResponse(CAR_SETTINGS)
-        self.data[CAR_SETTINGS] = self.ParseProfilesResponse(res)
-        return self.data[CAR_SETTINGS]
+    async def GetCarSettings(self, vin: str | None = None, max_age: float = 0):
+        """Get the car settings of one vehicle, None when the gateway sent none."""
+        vin = vin or self.vin
 
-    async def GetDigitalTwin(self):
-        self.data[DIGITAL_TWIN] = self.flatten_json(
-            self.ParseDigitalTwinResponse(
-                await self.__GetWebsocketResponse(DIGITAL_TWIN)
-            )
+        # Car settings may already have arrived as a side effect of a twin fetch
+        if (
+            max_age > 0
+            and vin in self.car_settings
+            and time.monotonic() - self._car_settings_received[vin] < max_age
+        ):
+            return self.car_settings[vin]
+
+        # Stored on arrival, by the session that only asks for this vehicle
+        await self.__GetWebsocketResponse(CAR_SETTINGS, vin)
+        return self.car_settings.get(vin)
+
+    async def GetDigitalTwin(self, vin: str | None = None):
+        """Get the digital twin of one vehicle.
+
+        The session that fetches it also fetches the other vehicles of the
+        account that are polled within TWIN_BATCH_MAX_AGE, they pick up
+        their frame without opening a connection of their own. A vehicle
+        polled later, e.g. one that is asleep, is left for its own poll.
+        """
+        async with self._twin_lock:
+            if not self.vins:
+                await self.__FetchDigitalTwins(vin)
+            vin = vin or self.vin
+
+            frame = self._twin_frames.get(vin)
+            if frame is None or time.monotonic() - frame[0] > TWIN_BATCH_MAX_AGE:
+                await self.__FetchDigitalTwins(vin)
+                frame = self._twin_frames.get(vin)
+
+            if frame is None:
+                raise RequestDataError(f"No digital twin received for vin={vin}")
+
+            del self._twin_frames[vin]
+
+        # A parked, sleeping car often sends byte-identical frames, they were
+        # recognised by their digest on arrival and never decoded. Hand back
+        # the previous snapshot unchanged.
+        _, digest, message = frame
+        previous = self._twin_digests.get(vin)
+        if previous is not None and previous[0] == digest:
+            self.skipped_frames += 1
+            self.data[DIGITAL_TWIN] = previous[1]
+            return previous[1]
+
+        self.data[DIGITAL_TWIN] = DigitalTwinSnapshot.from_twin(
+            self.ParseDigitalTwinResponse(message)
         )
+        if previous is not None:
+            self._twin_digest_vins.pop(previous[0], None)
+        self._twin_digests[vin] = (digest, self.data[DIGITAL_TWIN])
+        self._twin_digest_vins[digest] = vin
         return self.data[DIGITAL_TWIN]
 
+    def SetNextPoll(self, vin: str, delay: float):
+        """Tell in how many seconds the vehicle is polled next."""
+        self._twin_due[vin] = time.monotonic() + delay
+
     async def GetProfiles(self):
-        self.data[PROFILES] = self.flatten_json(
-            self.ParseProfilesResponse(await self.__GetWebsocketResponse(PROFILES))
+        profiles = self.ParseProfilesResponse(
+            await self.__GetWebsocketResponse(PROFILES)
         )
+        self.__StoreProfiles(profiles)
+        self.data[PROFILES] = self.flatten_json(profiles)
         _LOGGER.debug(self.data[PROFILES])
         return self.data[PROFILES]
 
-    def ParseDigitalTwinResponse(self, jsonMsg):
+    async def GetVins(self) -> list[str]:
+        """Return the VIN of every vehicle on the account."""
+        if not self.vins:
+            await self.GetProfiles()
+        return self.vins
+
+    def GetProfile(self, vin: str) -> dict:
+        """Return the profile of a vehicle, it holds e.g. the BLE key."""
+        for profile in self.profiles:
+            if profile.get("vin") == vin:
+                return profile
+        return {}
+
+    def __StoreProfiles(self, profiles):
+        if not isinstance(profiles, list):
+            return
+
+        self.profiles = profiles
+        self.vins = [profile["vin"] for profile in profiles if profile.get("vin")]
+        if self.vin not in self.vins:
+            self.vin = self.vins[0] if self.vins else ""
+        if PROFILES in self.demand:
+            self.data[PROFILES] = self.flatten_json(profiles)
+
+    def __StoreCarSettings(self, message: dict, owners: set[str]):
+        # The frame does not name its vehicle, it belongs to the only one
+        # asked for in the session
+        if len(owners) != 1 or not isinstance(message.get("data"), list):
+            _LOGGER.debug("Ignoring car settings that belong to none of %s", owners)
+            return
+
+        vin = next(iter(owners))
+        self.car_settings[vin] = message
+        self._car_settings_received[vin] = time.monotonic()
+
+    def ParseDigitalTwinResponse(self, data: dict):
         # _LOGGER.debug('Start ParseDigitalTwinResponse()')
-        # Parse the JSON response into a Python dictionary
-        data = json.loads(jsonMsg)
+        # The frame was decoded once on arrival
         _LOGGER.debug(data)
 
         if data["handler"] != DIGITAL_TWIN:
@@ -260,22 +473,172 @@ class MyFiskerAPI:
         # _LOGGER.debug('Start DigitalTwinRequest()')
         data = {}
         messageData = {}
-        data["vin"] = self.vin
+        data["vin"] = vin
         messageData["data"] = data
         messageData["handler"] = DIGITAL_TWIN
         return messageData
 
-    async def SendCommandRequest(self, command: str, command_data: str = ""):
+    async def SendCommandRequest(
+        self, command: str, command_data: str = "", vin: str | None = None
+    ) -> CommandResult:
+        """Send a remote command over the live socket and wait for its reply."""
         # _LOGGER.debug('Start SendCommandRequest()')
+        vin = vin or self.vin
         data = {}
         messageData = {}
-        data["vin"] = self.vin
+        data["vin"] = vin
         data["command"] = command
         if data != "":
             data["data"] = command_data
         messageData["data"] = data
-        messageData["handler"] = "remote_command"
-        return await self.__SendWebsocketRequest(messageData)
+        messageData["handler"] = HANDLER_COMMAND
+
+        # Commands jump the queue of polls waiting for the gateway
+        await self._command_limiter.acquire(priority=True)
+        await self._data_limiter.acquire(priority=True)
+
+        async with self._command_lock:
+            ws = await self.__GetLiveWebsocket()
+
+            reply = asyncio.get_running_loop().create_future()
+            self._pending_command = (command, vin, reply)
+            self._last_command = time.monotonic()
+            try:
+                await ws.send_str(json.dumps(messageData))
+                async with asyncio.timeout(COMMAND_TIMEOUT):
+                    return await reply
+            except TimeoutError:
+                return CommandResult(
+                    command, False, message=f"No reply within {COMMAND_TIMEOUT}s"
+                )
+            finally:
+                self._pending_command = None
+
+    async def async_close(self):
+        """Close the live WebSocket connection."""
+        if self._websocket_reader is not None:
+            self._websocket_reader.cancel()
+            self._websocket_reader = None
+        if self._websocket is not None:
+            await self._websocket.close()
+            self._websocket = None
+        if self._websocket_session is not None:
+            await self._websocket_session.close()
+            self._websocket_session = None
+
+    async def __GetLiveWebsocket(self) -> aiohttp.ClientWebSocketResponse:
+        """Return the authenticated live socket, connecting when needed."""
+        async with self._websocket_lock:
+            if self._websocket is not None and not self._websocket.closed:
+                return self._websocket
+
+            await self.GetAuthTokenAsync()
+
+            session = self._session
+            if session is None:
+                if self._websocket_session is None or self._websocket_session.closed:
+                    self._websocket_session = aiohttp.ClientSession()
+                session = self._websocket_session
+
+            ws = await session.ws_connect(
+                self.__GetRegionURL(), headers=headers, heartbeat=self._heartbeat
+            )
+            try:
+                await ws.send_str(json.dumps(self.GenerateVerifyRequest()))
+                while True:
+                    message = json.loads(await self.__ReceiveStr(ws))
+                    if message["handler"] == "verify":
+                        break
+                if message["data"]["authenticated"] is not True:
+                    raise AuthenticationError("Live WebSocket was not authenticated")
+            except BaseException:
+                await ws.close()
+                raise
+
+            self._websocket = ws
+            self._websocket_reader = asyncio.create_task(self.__ReadLiveWebsocket(ws))
+            return ws
+
+    async def __ReadLiveWebsocket(self, ws: aiohttp.ClientWebSocketResponse):
+        """Dispatch frames of the live socket until it closes or has been idle too long."""
+        try:
+            while not ws.closed:
+                if (
+                    self._pending_command is None
+                    and time.monotonic() - self._last_command > LIVE_SOCKET_IDLE_TIMEOUT
+                ):
+                    break
+
+                try:
+                    response = await self.__ReceiveStr(ws)
+                except RequestTimeoutError:
+                    continue
+                except MyFiskerApiError as ex:
+                    _LOGGER.debug(f"Live WebSocket closed: {ex}")
+                    break
+
+                try:
+                    self.__DispatchLiveFrame(response)
+                except (ValueError, KeyError) as ex:
+                    _LOGGER.debug(f"Ignoring malformed frame on live WebSocket: {ex}")
+        finally:
+            if self._pending_command is not None:
+                reply = self._pending_command[2]
+                if not reply.done():
+                    reply.set_exception(RequestConnectionError("Live WebSocket closed"))
+            if self._websocket is ws:
+                self._websocket = None
+                self._websocket_reader = None
+            await ws.close()
+
+    def __DispatchLiveFrame(self, response: str):
+        message = json.loads(response)
+        handler = message["handler"]
+        data = message.get("data")
+        if not isinstance(data, dict):
+            data = {}
+
+        # Twins pushed on the live socket save the next poll a session
+        if handler == DIGITAL_TWIN and data.get("vin"):
+            self._twin_frames[data["vin"]] = (
+                time.monotonic(),
+                _frame_digest(response),
+                message,
+            )
+
+        if self._pending_command is None:
+            return
+        command, vin, reply = self._pending_command
+        if reply.done():
+            return
+
+        if handler == HANDLER_COMMAND and data.get("command", command) == command:
+            status = str(data.get("status", "")).lower()
+            success = data.get("success") is not False and status not in (
+                "error",
+                "failed",
+                "rejected",
+            )
+            reply.set_result(
+                CommandResult(
+                    command,
+                    success,
+                    confirmed=True,
+                    message=str(data.get("message", status)),
+                )
+            )
+
+        # Without an explicit acknowledgement a fresh twin is taken as the result
+        elif handler == DIGITAL_TWIN and data.get("vin", vin) == vin:
+            reply.set_result(CommandResult(command, True))
+
+    @asynccontextmanager
+    async def __Session(self):
+        if self._session is not None:
+            yield self._session
+        else:
+            async with aiohttp.ClientSession() as session:
+                yield session
 
     def __GetRegionURL(self):
         match self._region:
@@ -286,21 +649,157 @@ class MyFiskerAPI:
             case _:
                 return URL_WSS_US
 
-    async def __GetWebsocketResponse(self, responseToReturn: str):
+    async def __ReceiveStr(self, ws: aiohttp.ClientWebSocketResponse) -> str:
+        """Receive one text frame, failing fast on a silent or closed socket."""
+        try:
+            msg = await ws.receive(timeout=self._receive_timeout)
+        except asyncio.TimeoutError as ex:
+            raise RequestTimeoutError(
+                f"No frame received within {self._receive_timeout}s"
+            ) from ex
+
+        if msg.type in (
+            aiohttp.WSMsgType.CLOSE,
+            aiohttp.WSMsgType.CLOSING,
+            aiohttp.WSMsgType.CLOSED,
+            aiohttp.WSMsgType.ERROR,
+        ):
+            raise RequestConnectionError(f"WebSocket closed ({msg.type.name})")
+
+        if msg.type != aiohttp.WSMsgType.TEXT:
+            raise RequestDataError(f"Unexpected WebSocket frame ({msg.type.name})")
+
+        return msg.data
+
+    async def __WithReconnect(self, description: str, request, *args):
+        # A stale socket is detected by the heartbeat or the per-frame deadline,
+        # retry on a fresh connection instead of stalling the whole refresh.
+        for attempt in range(1, WS_RECONNECT_ATTEMPTS + 1):
+            try:
+                return await request(*args)
+            except (RequestTimeoutError, RequestConnectionError) as ex:
+                _LOGGER.warning(
+                    f"WebSocket stale while waiting for '{description}' ({ex}), attempt {attempt}/{WS_RECONNECT_ATTEMPTS}"
+                )
+                error = ex
+
+        raise error
+
+    async def __GetWebsocketResponse(
+        self, responseToReturn: str, vin: str | None = None
+    ):
+        return await self.__WithReconnect(
+            responseToReturn, self.__GetWebsocketResponseOnce, responseToReturn, vin
+        )
+
+    async def __FetchDigitalTwins(self, vin: str | None):
+        await self.__WithReconnect(DIGITAL_TWIN, self.__FetchDigitalTwinsOnce, vin)
+
+    async def __RequestDigitalTwins(self, ws, vin: str | None) -> set[str]:
+        # The vehicle asked for, and the ones due before its frame goes stale.
+        # A vehicle that has not been polled yet counts as due.
+        now = time.monotonic()
+        vins = {
+            other
+            for other in self.vins
+            if other == vin
+            or self._twin_due.get(other, now) - now <= TWIN_BATCH_MAX_AGE
+        }
+        for other in vins:
+            await ws.send_str(json.dumps(self.DigitalTwinRequest(other)))
+        return vins
+
+    async def __FetchDigitalTwinsOnce(self, vin: str | None):
+        """Fetch the digital twin of a vehicle, and of the others that are due, over one session."""
+        HasAUTH = False
+        requested: set[str] = set()
+        pending: set[str] = set()
+
+        await self._data_limiter.acquire()
+
+        wssUrl = self.__GetRegionURL()
+
+        async with self.__Session() as session:
+            async with session.ws_connect(
+                wssUrl, headers=headers, heartbeat=self._heartbeat
+            ) as ws:
+                await ws.send_str(json.dumps(self.GenerateVerifyRequest()))
+                while True:
+                    response = await self.__ReceiveStr(ws)
+
+                    # An unchanged twin is known by its digest, it is not decoded
+                    digest = _frame_digest(response)
+                    twin_vin = self._twin_digest_vins.get(digest)
+                    if twin_vin is None:
+                        message = json.loads(response)
+                        handler = message["handler"]
+                    else:
+                        message = None
+                        handler = DIGITAL_TWIN
+
+                    if handler == "verify" and HasAUTH is not True:
+                        HasAUTH = message["data"]["authenticated"] is True
+
+                        # Profiles are only needed to learn the VINs, or when consumed
+                        if PROFILES in self.demand or not self.vins:
+                            await ws.send_str(
+                                json.dumps(self.GenerateProfilesRequest())
+                            )
+                        else:
+                            requested = await self.__RequestDigitalTwins(ws, vin)
+                            pending = set(requested)
+
+                    elif handler == PROFILES and not pending:
+                        self.__StoreProfiles(message["data"])
+                        if not self.vins:
+                            raise RequestDataError("No vehicles found on the account")
+
+                        requested = await self.__RequestDigitalTwins(ws, vin)
+                        pending = set(requested)
+
+                    elif handler == CAR_SETTINGS:
+                        self.__StoreCarSettings(message, requested or set(self.vins))
+
+                    elif handler == DIGITAL_TWIN:
+                        if twin_vin is None:
+                            twin_vin = message["data"].get("vin") or self.vin
+                        self._twin_frames[twin_vin] = (
+                            time.monotonic(),
+                            digest,
+                            message,
+                        )
+                        pending.discard(twin_vin)
+
+                        if not pending:
+                            try:
+                                await ws.close()
+                            except Exception as e:
+                                _LOGGER.debug(
+                                    f"Error occurred while closing WebSocket: {e}"
+                                )
+                            return
+
+    async def __GetWebsocketResponseOnce(
+        self, responseToReturn: str, vin: str | None = None
+    ):
         HasAUTH = False
         HasVIN = HasAUTH
 
+        await self._data_limiter.acquire()
+
         wssUrl = self.__GetRegionURL()
 
-        async with aiohttp.ClientSession() as session:
-            async with session.ws_connect(wssUrl, headers=headers) as ws:
+        async with self.__Session() as session:
+            async with session.ws_connect(
+                wssUrl, headers=headers, heartbeat=self._heartbeat
+            ) as ws:
                 await ws.send_str(json.dumps(self.GenerateVerifyRequest()))
                 while True:
-                    response = await ws.receive_str()
+                    response = await self.__ReceiveStr(ws)
                     handler = json.loads(response)["handler"]
 
                     if handler == CAR_SETTINGS:
-                        self.data[CAR_SETTINGS] = response
+                        self.__StoreCarSettings(json.loads(response), {vin or self.vin})
 
                     if handler == responseToReturn:
                         try:
@@ -324,16 +823,16 @@ class MyFiskerAPI:
 
                     if HasAUTH is True and HasVIN is not True:
                         if handler == PROFILES:
-                            self.vin = self.ParseProfilesResponse(response)
+                            self.__StoreProfiles(self.ParseProfilesResponse(response))
                             # print (f"vin = {vin}")
                             if self.vin != "":
                                 self.HasVIN = True
                                 # Send a message
                                 _LOGGER.debug(
-                                    f"Auth & VIN ok - Sending 'DigitalTwinRequest' to vin={self.vin}"
+                                    f"Auth & VIN ok - Sending 'DigitalTwinRequest' to vin={vin or self.vin}"
                                 )
                                 await ws.send_str(
-                                    json.dumps(self.DigitalTwinRequest(self.vin))
+                                    json.dumps(self.DigitalTwinRequest(vin or self.vin))
                                 )
 
                     if HasAUTH is True and HasVIN is True:
@@ -349,35 +848,6 @@ class MyFiskerAPI:
 
                             return response
 
-    async def __SendWebsocketRequest(self, commandToSend: str):
-        HasAUTH = False
-        wssUrl = self.__GetRegionURL()
-
-        async with aiohttp.ClientSession() as session:
-            async with session.ws_connect(wssUrl, headers=headers) as ws:
-                await ws.send_str(json.dumps(self.GenerateVerifyRequest()))
-                while True:
-                    response = await ws.receive_str()
-                    handler = json.loads(response)["handler"]
-
-                    if handler in (DIGITAL_TWIN, CAR_SETTINGS):
-                        try:
-                            await ws.close()
-                        except Exception as e:
-                            _LOGGER.debug(
-                                f"Error occurred while closing WebSocket: {e}"
-                            )
-                        return response
-
-                    if HasAUTH is not True:
-                        if handler == "verify":
-                            HasAUTH = (
-                                json.loads(response)["data"]["authenticated"] is True
-                            )
-                            # Send a message
-                            # _LOGGER.debug(f"Sending 'GenerateProfilesRequest'")
-                            await ws.send_str(json.dumps(commandToSend))
-
     def flatten_json(self, jsonIn):
         out = {}
 
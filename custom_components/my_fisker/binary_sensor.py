@@ -3,11 +3,13 @@
 import logging
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import FiskerBaseEntity, FiskerSensorEntityDescription
+from .catalog import partition_snapshot
 from .const import (
     CLIMATE_CONTROL_STEERING_WHEEL_HEAT,
     DEVICE_MANUCFACTURER,
@@ -16,7 +18,6 @@ from .const import (
     DOOR_LOCK,
     GEAR_IN_PARK,
 )
-from .entities_binary_sensor import BINARY_SENSORS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,17 +29,14 @@ async def async_setup_entry(
 
     my_Fisker_data = hass.data[DOMAIN][entry.entry_id]
 
-    coordinator = my_Fisker_data._coordinator
-
     entities: list[FiskerSensor] = []
 
-    # for sensor in SENSORS:
-    for idx in enumerate(coordinator.data):
-        sens = get_sensor_by_key(idx[1])
-        if sens is None:
-            _LOGGER.warning(idx[1])
-        else:
-            entities.append(FiskerSensor(idx, sens, my_Fisker_data))
+    for coordinator in my_Fisker_data.coordinators.values():
+        platforms, _ = partition_snapshot(coordinator)
+        entities.extend(
+            FiskerSensor(coordinator, idx, sens, my_Fisker_data)
+            for idx, sens in platforms[Platform.BINARY_SENSOR]
+        )
 
     # Add entities to Home Assistant
     async_add_entities(entities)
@@ -47,13 +45,13 @@ async def async_setup_entry(
 class FiskerSensor(FiskerBaseEntity, CoordinatorEntity):
     """Sensor used by all Fisker entities, inherits from CoordinatorEntity."""
 
-    def __init__(self, idx, sensor: FiskerSensorEntityDescription, client):
+    def __init__(self, coordinator, idx, sensor: FiskerSensorEntityDescription, client):
         """Initialize My Fisker vehicle sensor."""
-        super().__init__(client._coordinator, idx)
+        super().__init__(coordinator, idx)
 
         self.idx = idx
         self._data = client
-        self._coordinator = client._coordinator
+        self._coordinator = coordinator
         self.entity_description = sensor
         self._attr_unique_id = f"{self._coordinator.data['vin']}_{sensor.key}"
         self._attr_name = f"{self._coordinator.alias} {sensor.name}"
@@ -114,11 +112,3 @@ class FiskerSensor(FiskerBaseEntity, CoordinatorEntity):
         except (KeyError, ValueError):
             return None
         return state
-
-
-# Get an item by its key
-def get_sensor_by_key(key):
-    for sensor in BINARY_SENSORS:
-        if sensor.key == key:
-            return sensor
-    return None
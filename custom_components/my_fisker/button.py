@@ -11,7 +11,6 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import FiskerBaseEntity, FiskerButtonEntityDescription, MyFiskerCoordinator
-from .api import MyFiskerAPI
 from .const import DEVICE_MANUCFACTURER, DEVICE_MODEL, DOMAIN
 from .entities_button import BUTTON_ENTITIES
 
@@ -64,22 +63,23 @@ class FiskerButton(FiskerBaseEntity, ButtonEntity):
         """Press the button."""
         _LOGGER.info("Press %s", self.entity_description.key)
 
-        api: MyFiskerAPI = self._coordinator.my_fisker_api
+        self._coordinator.async_wake()
 
         try:
-            if self.entity_description.command_data:
-                await api.SendCommandRequest(
-                    self.entity_description.command,
-                    self.entity_description.command_data,
-                )
-            else:
-                await api.SendCommandRequest(self.entity_description.command)
+            result = await self._coordinator.command_queue.async_submit(
+                self.entity_description.command_group,
+                self.entity_description.command,
+                self.entity_description.command_data or "",
+            )
         except Exception as exc:
             raise HomeAssistantError(
                 f"Running command '{self.entity_description.key}' failed"
             ) from exc
 
-        await self._coordinator.async_request_refresh()
+        if not result.success:
+            raise HomeAssistantError(
+                f"Running command '{self.entity_description.key}' failed: {result.message}"
+            )
 
 
 async def async_setup_entry(
@@ -89,11 +89,10 @@ async def async_setup_entry(
 
     my_Fisker_data = hass.data[DOMAIN][entry.entry_id]
 
-    coordinator = my_Fisker_data._coordinator
-
     entities: list[FiskerButton] = []
 
-    for but in BUTTON_ENTITIES:
-        entities.append(FiskerButton(coordinator, but))
+    for coordinator in my_Fisker_data.coordinators.values():
+        for but in BUTTON_ENTITIES:
+            entities.append(FiskerButton(coordinator, but))
 
     async_add_entities(entities, True)
@@ -0,0 +1,53 @@
+"""Catalog of the entities created from digital twin keys."""
+
+import logging
+
+from homeassistant.const import Platform
+
+from .entities_binary_sensor import BINARY_SENSORS
+from .entities_sensor import SENSORS_DIGITAL_TWIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Digital twin key -> (platform, description), built once at import
+ENTITY_CATALOG = {
+    description.key: (platform, description)
+    for platform, descriptions in (
+        (Platform.SENSOR, SENSORS_DIGITAL_TWIN),
+        (Platform.BINARY_SENSOR, BINARY_SENSORS),
+    )
+    for description in descriptions
+}
+
+
+def partition_snapshot(coordinator):
+    """Split the snapshot keys of a coordinator into platforms, in one pass.
+
+    Returns {platform: [(idx, description)]} and the keys without an entity.
+    The result is kept on the coordinator, so every platform reuses it.
+    """
+    if coordinator.entity_partition is not None:
+        return coordinator.entity_partition
+    if coordinator.data is None:
+        return {Platform.SENSOR: [], Platform.BINARY_SENSOR: []}, []
+
+    platforms = {Platform.SENSOR: [], Platform.BINARY_SENSOR: []}
+    unknown = []
+
+    for idx in enumerate(coordinator.data):
+        entry = ENTITY_CATALOG.get(idx[1])
+        if entry is None:
+            unknown.append(idx[1])
+        else:
+            platforms[entry[0]].append((idx, entry[1]))
+
+    if unknown:
+        _LOGGER.debug(
+            "Fisker '%s': %d digital twin keys without an entity: %s",
+            coordinator.alias,
+            len(unknown),
+            ", ".join(unknown),
+        )
+
+    coordinator.entity_partition = (platforms, unknown)
+    return coordinator.entity_partition
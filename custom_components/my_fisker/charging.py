@@ -0,0 +1,68 @@
+"""Online estimate of the charge rate of a charging vehicle."""
+
+from __future__ import annotations
+
+import math
+
+
+class ChargeRateEstimator:
+    """Exponentially weighted least squares fit of battery % over time.
+
+    Only the weighted sums of the fit are kept, a sample is folded in by
+    decaying them by its age and adding it, so an update costs O(1) and no
+    history is kept. Older samples fade out with the half life, which lets
+    the estimate follow the taper towards a full battery.
+    """
+
+    def __init__(self, half_life: float):
+        self._decay = math.log(2) / half_life
+        self.reset()
+
+    def reset(self):
+        self._origin = None
+        self._last = None
+        self._percent = None
+        self._sw = self._st = self._sy = self._stt = self._sty = 0.0
+        self.samples = 0
+
+    def add(self, timestamp: float, percent: float):
+        if self._origin is None:
+            self._origin = timestamp
+            self._last = timestamp
+        # Hours since the first sample, keeps the sums well conditioned
+        t = (timestamp - self._origin) / 3600
+        w = math.exp(-self._decay * (timestamp - self._last))
+        self._last = timestamp
+
+        self._sw = self._sw * w + 1
+        self._st = self._st * w + t
+        self._sy = self._sy * w + percent
+        self._stt = self._stt * w + t * t
+        self._sty = self._sty * w + t * percent
+        self._percent = percent
+        self.samples += 1
+
+    @property
+    def rate(self) -> float | None:
+        """Return the charge rate in % per hour, None until it can be told."""
+        denominator = self._sw * self._stt - self._st * self._st
+        if self.samples < 2 or denominator <= 1e-12:
+            return None
+        slope = (self._sw * self._sty - self._st * self._sy) / denominator
+        return slope if slope > 0 else None
+
+    def power(self, capacity: float) -> float | None:
+        """Return the charge power in kW for a battery of capacity kWh."""
+        rate = self.rate
+        if rate is None or not capacity:
+            return None
+        return round(rate * capacity / 100, 1)
+
+    def minutes_to(self, target: float) -> int | None:
+        """Return the minutes until the battery reaches target %."""
+        rate = self.rate
+        if rate is None:
+            return None
+        if self._percent >= target:
+            return 0
+        return round((target - self._percent) / rate * 60)
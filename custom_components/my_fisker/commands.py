@@ -0,0 +1,120 @@
+"""Per-vehicle queue that coalesces and de-bounces remote commands."""
+
+import asyncio
+from dataclasses import dataclass, field, replace
+import logging
+import time
+
+from .api import CommandResult
+from .const import COMMAND_DEBOUNCE, COMMAND_DUPLICATE_WINDOW
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class QueuedCommand:
+    """A command waiting to be sent."""
+
+    group: str
+    command: str
+    command_data: str = ""
+    future: asyncio.Future = field(default=None, repr=False)
+
+
+class FiskerCommandQueue:
+    """Queue commands of one vehicle.
+
+    Commands in the same group supersede each other (the last lock/unlock
+    wins), repeated presses of the same command are de-bounced, and one
+    refresh is requested once the queue has drained. The expected outcome of
+    a command is shown as soon as it is queued, see async_apply_prediction.
+    """
+
+    def __init__(self, coordinator, debounce: float = COMMAND_DEBOUNCE):
+        self._coordinator = coordinator
+        self._debounce = debounce
+        self._pending: dict[str, QueuedCommand] = {}
+        self._last_sent: dict[str, tuple[str, str, float, CommandResult]] = {}
+        self._worker: asyncio.Task | None = None
+
+    async def async_submit(
+        self, group: str, command: str, command_data: str = ""
+    ) -> CommandResult:
+        """Queue a command and wait for its result."""
+        queued = self._pending.get(group)
+
+        # Same command already waiting, share its result
+        if queued is not None and (queued.command, queued.command_data) == (
+            command,
+            command_data,
+        ):
+            return await asyncio.shield(queued.future)
+
+        # Same command was just sent successfully, nothing to do
+        last = self._last_sent.get(group)
+        if (
+            queued is None
+            and last is not None
+            and (last[0], last[1]) == (command, command_data)
+            and time.monotonic() - last[2] < COMMAND_DUPLICATE_WINDOW
+            and last[3].success
+        ):
+            _LOGGER.debug("Command '%s' de-bounced", command)
+            return last[3]
+
+        if queued is not None:
+            _LOGGER.debug("Command '%s' superseded by '%s'", queued.command, command)
+            self._coordinator.async_discard_prediction(queued.command)
+            queued.future.set_result(
+                CommandResult(queued.command, True, superseded=True)
+            )
+
+        self._coordinator.async_apply_prediction(command)
+
+        queued = QueuedCommand(
+            group,
+            command,
+            command_data,
+            asyncio.get_running_loop().create_future(),
+        )
+        self._pending[group] = queued
+
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._async_drain())
+
+        return await asyncio.shield(queued.future)
+
+    async def _async_drain(self):
+        api = self._coordinator.my_fisker_api
+
+        # A command queued while the refresh runs finds this worker still
+        # busy, it is sent in another round instead of a worker of its own
+        while self._pending:
+            # Let a burst of presses settle before sending anything
+            await asyncio.sleep(self._debounce)
+
+            while self._pending:
+                group = next(iter(self._pending))
+                queued = self._pending.pop(group)
+
+                try:
+                    result = await api.SendCommandRequest(
+                        queued.command, queued.command_data, vin=self._coordinator.vin
+                    )
+                except Exception as ex:  # pylint: disable=broad-except
+                    self._coordinator.async_discard_prediction(queued.command)
+                    queued.future.set_exception(ex)
+                    continue
+
+                if not result.success:
+                    self._coordinator.async_discard_prediction(queued.command)
+
+                self._last_sent[group] = (
+                    queued.command,
+                    queued.command_data,
+                    time.monotonic(),
+                    replace(result, message="Already sent"),
+                )
+                queued.future.set_result(result)
+
+            await self._coordinator.async_request_refresh()
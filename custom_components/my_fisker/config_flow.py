@@ -9,13 +9,22 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_ALIAS, CONF_PASSWORD, CONF_REGION, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
 # from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from .api import MyFiskerAPI
-from .const import DOMAIN
+from .const import (
+    CONF_DEADBAND_PREFIX,
+    CONF_TRACK,
+    CONF_WS_HEARTBEAT,
+    CONF_WS_RECEIVE_TIMEOUT,
+    DOMAIN,
+    WS_HEARTBEAT_INTERVAL,
+    WS_RECEIVE_TIMEOUT,
+)
+from .entities_sensor import SENSORS_DIGITAL_TWIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -46,12 +55,12 @@ async def validate_login(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         raise InvalidAuth
 
     try:
-        vin = await api.GetProfiles()
+        vins = await api.GetVins()
     except:
         raise CannotConnect
 
     # Return info that you want to store in the config entry.
-    return vin
+    return ", ".join(vins)
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -84,6 +93,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_alias(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -107,6 +124,46 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle the sensor deadband, track and connection options of My Fisker."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the sensor deadbands, track recording and socket liveness."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._config_entry.options
+        schema = {
+            vol.Required(
+                CONF_DEADBAND_PREFIX + sensor.key,
+                default=options.get(CONF_DEADBAND_PREFIX + sensor.key, sensor.deadband),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0))
+            for sensor in SENSORS_DIGITAL_TWIN
+            if sensor.deadband is not None
+        }
+        schema[vol.Required(CONF_TRACK, default=options.get(CONF_TRACK, False))] = bool
+        schema[
+            vol.Required(
+                CONF_WS_HEARTBEAT,
+                default=options.get(CONF_WS_HEARTBEAT, WS_HEARTBEAT_INTERVAL),
+            )
+        ] = vol.All(vol.Coerce(float), vol.Range(min=1))
+        schema[
+            vol.Required(
+                CONF_WS_RECEIVE_TIMEOUT,
+                default=options.get(CONF_WS_RECEIVE_TIMEOUT, WS_RECEIVE_TIMEOUT),
+            )
+        ] = vol.All(vol.Coerce(float), vol.Range(min=1))
+
+        return self.async_show_form(step_id="init", data_schema=vol.Schema(schema))
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
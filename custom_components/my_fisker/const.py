@@ -7,6 +7,62 @@ DEVICE_MODEL = "Fisker (Ocean)"
 
 API_TIMEOUT = 10
 DEFAULT_SCAN_INTERVAL = 30
+ACTIVE_SCAN_INTERVAL = 20
+LOCKED_SCAN_INTERVAL = 60
+DEEP_IDLE_SCAN_INTERVAL = 900
+# Refresh rate while driving near a zone, to catch the arrival
+ZONE_SCAN_INTERVAL = 10
+# Time the normal refresh rate is held after a command wakes the vehicle
+WAKE_GRACE_PERIOD = 300
+
+# Options key of a sensor's deadband override, followed by the sensor key
+CONF_DEADBAND_PREFIX = "deadband_"
+# Options key that turns on recording of the driven track
+CONF_TRACK = "track"
+# Options keys of the WebSocket ping interval and per-frame receive deadline
+CONF_WS_HEARTBEAT = "ws_heartbeat"
+CONF_WS_RECEIVE_TIMEOUT = "ws_receive_timeout"
+
+# Device tracker: meters moved before the location is written, while driving and while parked
+TRACKER_MIN_DISTANCE = 25
+TRACKER_PARKED_DISTANCE = 250
+# Track compression: max deviation in meters and max points kept per trip
+TRACK_TOLERANCE = 15
+TRACK_MAX_POINTS = 500
+
+# WebSocket liveness: ping interval, per-frame receive deadline and reconnect attempts
+WS_HEARTBEAT_INTERVAL = 10
+WS_RECEIVE_TIMEOUT = 5
+WS_RECONNECT_ATTEMPTS = 2
+
+# Gateway sessions allowed in flight at the same time, across all accounts
+MAX_CONCURRENT_SESSIONS = 4
+
+# Token buckets per account and endpoint class: (requests per second, burst size)
+RATE_LIMIT_AUTH = (1 / 60, 2)
+RATE_LIMIT_DATA = (1 / 2, 6)
+RATE_LIMIT_COMMAND = (1 / 2, 3)
+
+# Keys in hass.data[DOMAIN] that are not config entries
+DATA_CONNECTIONS = "connections"
+DATA_SCHEDULER = "scheduler"
+DATA_GEOFENCES = "geofences"
+
+# Zone index: grid cell size, and how far outside a zone counts as approaching it, in meters
+GEOFENCE_CELL_SIZE = 2000
+GEOFENCE_APPROACH_MARGIN = 1000
+
+# Remote commands: reply deadline, and idle time before the live socket is closed
+COMMAND_TIMEOUT = 15
+LIVE_SOCKET_IDLE_TIMEOUT = 300
+
+# Commands queued within this window are coalesced, a repeat of a command sent within the duplicate window is dropped
+COMMAND_DEBOUNCE = 1.0
+COMMAND_DUPLICATE_WINDOW = 5
+
+# Frames fetched in one session are reused by the other coordinators of the account for this long,
+# a vehicle polled within this time is fetched along with the one that is due
+TWIN_BATCH_MAX_AGE = 10
 
 URL_TOKEN = "https://auth.fiskerdps.com/auth/login"
 URL_TOKEN_REFRESH = "https://auth.fiskerdps.com/auth/refresh"
@@ -20,6 +76,49 @@ COMMAND_TRUNK_OPEN = "trunk_open"
 COMMAND_TRUNK_CLOSE = "trunk_close"
 COMMAND_CALIFORNIA_MODE = "california_mode"
 
+# Values a command is expected to produce, shown before the car confirms them
+COMMAND_PREDICTIONS = {
+    COMMAND_DOORS_LOCK: {"door_locks_all": True, "door_locks_driver": True},
+    COMMAND_DOORS_UNLOCK: {"door_locks_all": False, "door_locks_driver": False},
+    COMMAND_TRUNK_OPEN: {"doors_trunk": True},
+    COMMAND_TRUNK_CLOSE: {"doors_trunk": False},
+}
+# Predictions are confirmed by polling at this cadence, and dropped when not confirmed in time
+CONFIRM_SCAN_INTERVAL = 5
+PREDICTION_TIMEOUT = 60
+
+# Trip history: seconds finished trips are buffered before they are written, and file size before rotation
+TRIP_FLUSH_DELAY = 60
+TRIP_STORE_MAX_BYTES = 1024 * 1024
+# Running trip and charge statistics: store version and seconds between checkpoints
+STATS_STORE_VERSION = 1
+STATS_SAVE_DELAY = 60
+# Half life in seconds of the samples in the charge rate estimate
+CHARGE_RATE_HALF_LIFE = 900
+
+# Range prediction: weight of a new trip once warmed up, trips a band needs before it is used,
+# and km a trip needs to be learned from
+RANGE_MODEL_ALPHA = 0.1
+RANGE_MODEL_MIN_TRIPS = 3
+RANGE_MODEL_MIN_DISTANCE = 5
+
+# Snapshots a new vehicle state must be seen on before it is taken over
+VEHICLE_STATE_DEBOUNCE = 2
+# Bus events fired on vehicle state transitions
+EVENT_VEHICLE_STATE_CHANGED = f"{DOMAIN}_state_changed"
+EVENT_TRIP_STARTED = f"{DOMAIN}_trip_started"
+EVENT_TRIP_ENDED = f"{DOMAIN}_trip_ended"
+EVENT_CHARGING_STARTED = f"{DOMAIN}_charging_started"
+EVENT_CHARGING_ENDED = f"{DOMAIN}_charging_ended"
+
+# Least seconds between two my_fisker/subscribe messages, changes in between are coalesced
+WS_SUBSCRIBE_INTERVAL = 1.0
+# Dispatcher signal sent with a coordinator that is going away, e.g. on a reload
+SIGNAL_COORDINATOR_UNLOADED = f"{DOMAIN}_coordinator_unloaded"
+
+# Records returned by my_fisker.get_trips unless a limit is given
+TRIP_QUERY_LIMIT = 100
+
 TRIM_EXTREME_ULTRA_BATT_CAPACITY = 106
 TRIM_SPORT_BATT_CAPACITY = 75
 
@@ -4,11 +4,19 @@ from homeassistant.components.device_tracker import SourceType
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
 from homeassistant.components.sensor import SensorEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import FiskerBaseEntity, FiskerSensorEntityDescription
-from .const import DOMAIN
+from .const import (
+    CONF_TRACK,
+    DOMAIN,
+    TRACK_MAX_POINTS,
+    TRACK_TOLERANCE,
+    TRACKER_MIN_DISTANCE,
+    TRACKER_PARKED_DISTANCE,
+)
+from .track import TrackCompressor, distance
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,31 +29,45 @@ async def async_setup_entry(
     """Add sensors for passed config_entry in HA."""
 
     my_Fisker_data = hass.data[DOMAIN][config_entry.entry_id]
-    coordinator = my_Fisker_data._coordinator
     entities: list[DeviceTrackerSensor] = []
 
-    # Fetch initial data so we have data when entities subscribe
-    await coordinator.async_config_entry_first_refresh()
-
+    # Initial data was fetched for every coordinator in async_setup_entry
     sens = DEVICE_TRACKER_SENSORS[0]
-    entities.append(DeviceTrackerSensor(sens, my_Fisker_data))
+    for coordinator in my_Fisker_data.coordinators.values():
+        entities.append(
+            DeviceTrackerSensor(
+                coordinator,
+                sens,
+                my_Fisker_data,
+                config_entry.options.get(CONF_TRACK, False),
+            )
+        )
 
     if entities:
         async_add_entities(entities)
 
 
 class DeviceTrackerSensor(FiskerBaseEntity, TrackerEntity):
-    """Representation of a vehicle device_Tracker sensor."""
+    """Representation of a vehicle device_Tracker sensor.
+
+    The location is only written when the vehicle really moved, GPS jitter
+    of a parked vehicle is ignored.
+    """
+
+    # The track can hold hundreds of points, keep it out of the recorder
+    _unrecorded_attributes = frozenset({"track"})
 
     def __init__(
         self,
+        coordinator,
         sensor: FiskerSensorEntityDescription,
         client,
+        track: bool = False,
     ) -> None:
         """Initialize My Fisker vehicle sensor."""
-        super().__init__(client._coordinator, -1)
+        super().__init__(coordinator, -1)
 
-        self._coordinator = client._coordinator
+        self._coordinator = coordinator
         self._data = client
         self.entity_description = sensor
         self._attr_unique_id = (
@@ -55,6 +77,50 @@ class DeviceTrackerSensor(FiskerBaseEntity, TrackerEntity):
 
         _LOGGER.info(self._attr_unique_id)
 
+        self._latitude = None
+        self._longitude = None
+        self._was_parked = True
+        self._track = (
+            TrackCompressor(TRACK_TOLERANCE, TRACK_MAX_POINTS) if track else None
+        )
+        self._accept_location()
+
+    def _accept_location(self) -> bool:
+        """Take over the reported location if the vehicle moved far enough."""
+        data = self._coordinator.data
+        if data is None:
+            return False
+        lat = data.get("location_latitude")
+        lon = data.get("location_longitude")
+        if lat is None or lon is None:
+            return False
+
+        parked = data.get("gear_in_park") is not False and not data.get(
+            "vehicle_speed_speed"
+        )
+        if self._track is not None and self._was_parked and not parked:
+            # A new trip starts a new track
+            self._track.clear()
+            self._track.add(self._latitude or lat, self._longitude or lon)
+        self._was_parked = parked
+
+        if self._latitude is not None:
+            moved = distance(self._latitude, self._longitude, lat, lon)
+            if moved < (TRACKER_PARKED_DISTANCE if parked else TRACKER_MIN_DISTANCE):
+                return False
+
+        self._latitude = lat
+        self._longitude = lon
+        if self._track is not None and not parked:
+            self._track.add(lat, lon)
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only on real movement."""
+        if self._accept_location():
+            self.async_write_ha_state()
+
     @property
     def icon(self):
         return self.entity_description.icon
@@ -62,20 +128,12 @@ class DeviceTrackerSensor(FiskerBaseEntity, TrackerEntity):
     @property
     def latitude(self) -> float:
         """Return latitude value of the device."""
-        try:
-            lat = self._coordinator.data["location_latitude"]
-            return lat
-        except KeyError:
-            return None
+        return self._latitude
 
     @property
     def longitude(self) -> float:
         """Return longitude value of the device."""
-        try:
-            lon = self._coordinator.data["location_longitude"]
-            return lon
-        except KeyError:
-            return None
+        return self._longitude
 
     @property
     def battery_level(self) -> float:
@@ -93,19 +151,14 @@ class DeviceTrackerSensor(FiskerBaseEntity, TrackerEntity):
 
     @property
     def extra_state_attributes(self):
-        """Return timestamp of when the data was captured."""
+        """Return timestamp of when the data was captured, and the driven track."""
         try:
-            return {"last_captured": f"{self._coordinator.data['updated']}"}
+            attributes = {"last_captured": f"{self._coordinator.data['updated']}"}
         except KeyError:
             return None
-
-
-# Get an item by its key
-def get_sensor_by_key(key):
-    for sensor in DEVICE_TRACKER_SENSORS:
-        if sensor.key == key:
-            return sensor
-    return None
+        if self._track is not None:
+            attributes["track"] = [list(point) for point in self._track.points]
+        return attributes
 
 
 DEVICE_TRACKER_SENSORS: tuple[SensorEntityDescription, ...] = (
@@ -0,0 +1,36 @@
+"""Diagnostics support for My Fisker."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .catalog import partition_snapshot
+from .const import DOMAIN
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD, "vin"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    my_Fisker_data = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "vehicles": len(my_Fisker_data.coordinators),
+        "rate_limit": my_Fisker_data.api.rate_limit_stats,
+        "skipped_frames": my_Fisker_data.api.skipped_frames,
+        "unknown_keys": sorted(
+            {
+                key
+                for coordinator in my_Fisker_data.coordinators.values()
+                for key in partition_snapshot(coordinator)[1]
+            }
+        ),
+    }
@@ -11,6 +11,7 @@ BUTTON_ENTITIES: list[EntityDescription] = [
         translation_key="doors_unlock",
         icon="mdi:car-door-lock-open",
         command="doors_unlock",
+        command_group="doors",
     ),
     FiskerButtonEntityDescription(
         key="doors_lock",
@@ -18,6 +19,7 @@ BUTTON_ENTITIES: list[EntityDescription] = [
         translation_key="doors_lock",
         icon="mdi:car-door-lock",
         command="doors_lock",
+        command_group="doors",
     ),
     FiskerButtonEntityDescription(
         key="trunk_open",
@@ -25,6 +27,7 @@ BUTTON_ENTITIES: list[EntityDescription] = [
         translation_key="trunk_open",
         icon="mdi:car-back",
         command="trunk_open",
+        command_group="trunk",
     ),
     FiskerButtonEntityDescription(
         key="trunk_close",
@@ -32,6 +35,7 @@ BUTTON_ENTITIES: list[EntityDescription] = [
         translation_key="trunk_close",
         icon="mdi:car-back",
         command="trunk_close",
+        command_group="trunk",
     ),
     FiskerButtonEntityDescription(
         key="california_mode_on",
@@ -40,6 +44,7 @@ BUTTON_ENTITIES: list[EntityDescription] = [
         icon="mdi:car-convertible",
         command="california_mode",
         command_data="on",
+        command_group="california_mode",
     ),
     FiskerButtonEntityDescription(
         key="california_mode_off",
@@ -48,6 +53,7 @@ BUTTON_ENTITIES: list[EntityDescription] = [
         icon="mdi:car-convertible",
         command="cabin_temperature",
         command_data="off",
+        command_group="california_mode",
     ),
     #     FiskerButtonEntityDescription(
     #         key="cabin_temperature",
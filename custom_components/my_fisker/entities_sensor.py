@@ -5,6 +5,7 @@ from homeassistant.const import (
     PERCENTAGE,
     UnitOfEnergy,
     UnitOfLength,
+    UnitOfPower,
     UnitOfSpeed,
     UnitOfTemperature,
     UnitOfTime,
@@ -20,6 +21,8 @@ SENSORS_DIGITAL_TWIN: tuple[SensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         value=lambda data, key: data[key],
+        precision=0,
+        deadband=1,
     ),
     FiskerSensorEntityDescription(
         key="battery_charge_type",
@@ -36,6 +39,8 @@ SENSORS_DIGITAL_TWIN: tuple[SensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DISTANCE,
         native_unit_of_measurement=UnitOfLength.KILOMETERS,
         value=lambda data, key: data[key],
+        precision=0,
+        deadband=2,
     ),
     FiskerSensorEntityDescription(
         key="battery_percent",
@@ -84,6 +89,8 @@ SENSORS_DIGITAL_TWIN: tuple[SensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         value=lambda data, key: data[key],
+        precision=1,
+        deadband=0.5,
     ),
     FiskerSensorEntityDescription(
         key="climate_control_cabin_temperature",
@@ -92,6 +99,8 @@ SENSORS_DIGITAL_TWIN: tuple[SensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         value=lambda data, key: data[key],
+        precision=1,
+        deadband=0.5,
     ),
     FiskerSensorEntityDescription(
         key="climate_control_driver_seat_heat",
@@ -108,6 +117,8 @@ SENSORS_DIGITAL_TWIN: tuple[SensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         value=lambda data, key: data[key],
+        precision=1,
+        deadband=0.5,
     ),
     FiskerSensorEntityDescription(
         key="climate_control_passenger_seat_heat",
@@ -140,6 +151,8 @@ SENSORS_DIGITAL_TWIN: tuple[SensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DISTANCE,
         native_unit_of_measurement=UnitOfLength.METERS,
         value=lambda data, key: data[key],
+        precision=0,
+        deadband=5,
     ),
     FiskerSensorEntityDescription(
         key="location_latitude",
@@ -148,6 +161,8 @@ SENSORS_DIGITAL_TWIN: tuple[SensorEntityDescription, ...] = (
         device_class=None,
         native_unit_of_measurement="°",
         value=lambda data, key: data[key],
+        precision=5,
+        deadband=0.0001,
     ),
     FiskerSensorEntityDescription(
         key="location_longitude",
@@ -156,6 +171,8 @@ SENSORS_DIGITAL_TWIN: tuple[SensorEntityDescription, ...] = (
         device_class=None,
         native_unit_of_measurement="°",
         value=lambda data, key: data[key],
+        precision=5,
+        deadband=0.0001,
     ),
     FiskerSensorEntityDescription(
         key="trex_version",
@@ -181,6 +198,7 @@ SENSORS_DIGITAL_TWIN: tuple[SensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.SPEED,
         native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
         value=lambda data, key: data[key],
+        precision=0,
     ),
     FiskerSensorEntityDescription(
         key="vin",
@@ -401,3 +419,71 @@ SENSORS_ChargeStat: tuple[SensorEntityDescription, ...] = (
         value=lambda data, key: data[key],
     ),
 )
+
+SENSORS_ANALYTICS: tuple[SensorEntityDescription, ...] = (
+    FiskerSensorEntityDescription(
+        key="analytics_efficiency",
+        name="Average efficiency",
+        icon="mdi:chart-line",
+        device_class=None,
+        native_unit_of_measurement="kWh/100km",
+        value=lambda data, key: data[key],
+    ),
+    FiskerSensorEntityDescription(
+        key="analytics_efficiency_temperature",
+        name="Average efficiency at current temperature",
+        icon="mdi:thermometer-lines",
+        device_class=None,
+        native_unit_of_measurement="kWh/100km",
+        value=lambda data, key: data[key],
+    ),
+)
+
+SENSORS_CHARGE_RATE: tuple[SensorEntityDescription, ...] = (
+    FiskerSensorEntityDescription(
+        key="chargerate_power",
+        name="Charge power",
+        icon="mdi:ev-station",
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.KILO_WATT,
+        value=lambda data, key: data[key],
+    ),
+    FiskerSensorEntityDescription(
+        key="chargerate_time_to_80",
+        name="Charge time to 80%",
+        icon="mdi:battery-clock-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        value=lambda data, key: data[key],
+    ),
+    FiskerSensorEntityDescription(
+        key="chargerate_time_to_100",
+        name="Charge time to 100%",
+        icon="mdi:battery-clock",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        value=lambda data, key: data[key],
+    ),
+)
+
+SENSORS_PREDICTED_RANGE: tuple[SensorEntityDescription, ...] = (
+    FiskerSensorEntityDescription(
+        key="predicted_range",
+        name="Predicted range",
+        icon="mdi:map-marker-distance",
+        device_class=SensorDeviceClass.DISTANCE,
+        native_unit_of_measurement=UnitOfLength.KILOMETERS,
+        value=lambda data, key: data[key],
+    ),
+)
+
+SENSORS_VEHICLE_STATE: tuple[SensorEntityDescription, ...] = (
+    FiskerSensorEntityDescription(
+        key="vehicle_state",
+        name="Vehicle state",
+        icon="mdi:car-info",
+        device_class=None,
+        native_unit_of_measurement=None,
+        value=lambda data, key: data[key],
+    ),
+)
@@ -0,0 +1,120 @@
+"""Grid index of the Home Assistant zones, for cheap zone lookups of the fleet."""
+
+from collections import defaultdict
+import logging
+import math
+
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import TrackStates, async_track_state_change_filtered
+
+from .const import GEOFENCE_APPROACH_MARGIN, GEOFENCE_CELL_SIZE
+from .track import EARTH_RADIUS, distance
+
+_LOGGER = logging.getLogger(__name__)
+
+# Meters per degree of latitude
+_DEGREE = math.radians(1) * EARTH_RADIUS
+
+
+class GeofenceIndex:
+    """Zones bucketed in a grid of latitude/longitude cells.
+
+    A zone, grown by the approach margin, is stored in every cell its
+    bounding box overlaps. A lookup hashes the position to its cell and only
+    tests the few zones stored there, however many zones there are.
+    """
+
+    def __init__(
+        self,
+        cell_size: float = GEOFENCE_CELL_SIZE,
+        margin: float = GEOFENCE_APPROACH_MARGIN,
+    ):
+        self._step = cell_size / _DEGREE
+        self._margin = margin
+        self._cells: dict[tuple[int, int], list[tuple]] = defaultdict(list)
+        self.zones = 0
+
+    def _cell(self, lat: float, lon: float) -> tuple[int, int]:
+        return math.floor(lat / self._step), math.floor(lon / self._step)
+
+    def add(self, zone_id: str, lat: float, lon: float, radius: float):
+        reach = radius + self._margin
+        dlat = reach / _DEGREE
+        dlon = reach / (_DEGREE * max(math.cos(math.radians(lat)), 0.01))
+
+        lat_min, lon_min = self._cell(lat - dlat, lon - dlon)
+        lat_max, lon_max = self._cell(lat + dlat, lon + dlon)
+        zone = (zone_id, lat, lon, reach)
+        for cell_lat in range(lat_min, lat_max + 1):
+            for cell_lon in range(lon_min, lon_max + 1):
+                self._cells[(cell_lat, cell_lon)].append(zone)
+        self.zones += 1
+
+    def lookup(self, lat: float, lon: float) -> frozenset[str]:
+        """Return the zones the position is in or approaching."""
+        candidates = self._cells.get(self._cell(lat, lon))
+        if not candidates:
+            return frozenset()
+        return frozenset(
+            zone_id
+            for zone_id, zone_lat, zone_lon, reach in candidates
+            if distance(lat, lon, zone_lat, zone_lon) <= reach
+        )
+
+
+class FiskerGeofences:
+    """Zone index shared by all vehicles, rebuilt when a zone is edited."""
+
+    def __init__(self, hass: HomeAssistant):
+        self._hass = hass
+        self._index: GeofenceIndex | None = None
+        # Only state changes of zones are passed on
+        self._tracker = async_track_state_change_filtered(
+            hass, TrackStates(False, set(), {"zone"}), self._async_state_changed
+        )
+
+    @callback
+    def async_close(self):
+        """Stop following the zones."""
+        self._tracker.async_remove()
+
+    @callback
+    def _async_state_changed(self, event: Event):
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+
+        # The state of a zone is the number of persons in it, only the area matters
+        def area(state):
+            return state and (
+                state.attributes.get(ATTR_LATITUDE),
+                state.attributes.get(ATTR_LONGITUDE),
+                state.attributes.get("radius"),
+            )
+
+        if area(old_state) != area(new_state):
+            self._index = None
+
+    def _build(self) -> GeofenceIndex:
+        index = GeofenceIndex()
+        for state in self._hass.states.async_all("zone"):
+            try:
+                index.add(
+                    state.entity_id,
+                    float(state.attributes[ATTR_LATITUDE]),
+                    float(state.attributes[ATTR_LONGITUDE]),
+                    float(state.attributes.get("radius", 0)),
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+        _LOGGER.debug("Indexed %d zones", index.zones)
+        return index
+
+    @callback
+    def lookup(self, lat, lon) -> frozenset[str]:
+        """Return the zones the position is in or approaching."""
+        if lat is None or lon is None:
+            return frozenset()
+        if self._index is None:
+            self._index = self._build()
+        return self._index.lookup(lat, lon)
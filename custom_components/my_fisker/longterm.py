@@ -0,0 +1,108 @@
+"""Import of finished trips and charge sessions into the long-term statistics."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime
+import logging
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import UnitOfEnergy, UnitOfLength
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .tripstore import KIND_CHARGE, KIND_TRIP, TripRecord
+
+_LOGGER = logging.getLogger(__name__)
+
+# Statistic id suffix, name, unit, session kind and the amount a session adds
+STATISTICS = (
+    (
+        "trip_energy",
+        "trip energy",
+        UnitOfEnergy.KILO_WATT_HOUR,
+        KIND_TRIP,
+        lambda record: record.energy,
+    ),
+    (
+        "trip_distance",
+        "trip distance",
+        UnitOfLength.KILOMETERS,
+        KIND_TRIP,
+        lambda record: record.odometer_end - record.odometer_start,
+    ),
+    (
+        "charge_energy",
+        "charged energy",
+        UnitOfEnergy.KILO_WATT_HOUR,
+        KIND_CHARGE,
+        lambda record: record.energy,
+    ),
+)
+
+
+def statistic_id(vin: str, suffix: str) -> str:
+    return f"{DOMAIN}:{vin.lower()}_{suffix}"
+
+
+def _hour(timestamp: int) -> datetime:
+    return dt_util.utc_from_timestamp(timestamp).replace(
+        minute=0, second=0, microsecond=0
+    )
+
+
+async def async_import_statistics(
+    hass: HomeAssistant, vin: str, alias: str, records: list[TripRecord]
+):
+    """Add a batch of finished sessions to the hourly long-term statistics.
+
+    A session counts in the hour it ended. The state of an hour is what was
+    added in that hour, the sum keeps running across all hours.
+    """
+    for suffix, name, unit, kind, amount in STATISTICS:
+        hours: dict[datetime, float] = defaultdict(float)
+        for record in records:
+            if record.kind == kind:
+                hours[_hour(record.end)] += amount(record)
+        if not hours:
+            continue
+
+        stat_id = statistic_id(vin, suffix)
+        last = await get_instance(hass).async_add_executor_job(
+            get_last_statistics, hass, 1, stat_id, True, {"state", "sum"}
+        )
+
+        total = 0.0
+        last_start = None
+        if last.get(stat_id):
+            row = last[stat_id][0]
+            last_start = dt_util.utc_from_timestamp(row["start"])
+            total = row["sum"] or 0.0
+            # Sessions in the last imported hour are added to it
+            if last_start in hours:
+                total -= row["state"] or 0.0
+                hours[last_start] += row["state"] or 0.0
+
+        statistics = []
+        for start in sorted(hours):
+            if last_start is not None and start < last_start:
+                _LOGGER.debug("Skipping %s of %s, already imported", stat_id, start)
+                continue
+            total += hours[start]
+            statistics.append(StatisticData(start=start, state=hours[start], sum=total))
+
+        metadata = StatisticMetaData(
+            has_mean=False,
+            has_sum=True,
+            name=f"{alias} {name}",
+            source=DOMAIN,
+            statistic_id=stat_id,
+            unit_of_measurement=unit,
+        )
+        async_add_external_statistics(hass, metadata, statistics)
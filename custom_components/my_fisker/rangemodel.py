@@ -0,0 +1,116 @@
+"""Range prediction from the efficiency of past trips."""
+
+from __future__ import annotations
+
+import math
+
+# Width of a band: ambient temperature in °C and average speed in km/h
+TEMPERATURE_BAND = 5
+SPEED_BAND = 20
+
+
+def _band(value: float | None, width: int) -> int | None:
+    return None if value is None else math.floor(value / width)
+
+
+class _Mean:
+    """Running mean, plain at first and exponentially weighted once warmed up."""
+
+    __slots__ = ("mean", "count")
+
+    def __init__(self, mean: float = 0.0, count: int = 0):
+        self.mean = mean
+        self.count = count
+
+    def add(self, value: float, alpha: float):
+        self.count += 1
+        self.mean += (value - self.mean) * max(1 / self.count, alpha)
+
+
+class RangePredictor:
+    """Efficiency in kWh/100km per temperature band and speed band.
+
+    A finished trip updates its cell, its temperature band and the overall
+    mean, each in O(1). A prediction uses the most specific of those that
+    has seen enough trips.
+    """
+
+    def __init__(self, alpha: float, min_trips: int):
+        self._alpha = alpha
+        self._min_trips = min_trips
+        self._cells: dict[tuple[int, int], _Mean] = {}
+        self._temperatures: dict[int, _Mean] = {}
+        self._overall = _Mean()
+
+    @property
+    def trips(self) -> int:
+        return self._overall.count
+
+    def add(self, efficiency: float, temperature: float | None, speed: float | None):
+        """Learn from a finished trip."""
+        temperature_band = _band(temperature, TEMPERATURE_BAND)
+        speed_band = _band(speed, SPEED_BAND)
+
+        self._overall.add(efficiency, self._alpha)
+        if temperature_band is None:
+            return
+        self._temperatures.setdefault(temperature_band, _Mean()).add(
+            efficiency, self._alpha
+        )
+        if speed_band is not None:
+            self._cells.setdefault((temperature_band, speed_band), _Mean()).add(
+                efficiency, self._alpha
+            )
+
+    def efficiency(
+        self, temperature: float | None, speed: float | None = None
+    ) -> float | None:
+        """Return the expected efficiency in kWh/100km."""
+        temperature_band = _band(temperature, TEMPERATURE_BAND)
+        speed_band = _band(speed, SPEED_BAND)
+
+        for mean in (
+            self._cells.get((temperature_band, speed_band)),
+            self._temperatures.get(temperature_band),
+            self._overall,
+        ):
+            if mean is not None and mean.count >= self._min_trips and mean.mean > 0:
+                return mean.mean
+        return None
+
+    def predict(
+        self,
+        state_of_charge: float | None,
+        capacity: float,
+        temperature: float | None,
+        speed: float | None = None,
+    ) -> int | None:
+        """Return the predicted range in km."""
+        efficiency = self.efficiency(temperature, speed)
+        if efficiency is None or state_of_charge is None or not capacity:
+            return None
+        return round(state_of_charge * capacity / efficiency)
+
+    def as_dict(self) -> dict:
+        return {
+            "cells": [
+                [temperature, speed, mean.mean, mean.count]
+                for (temperature, speed), mean in self._cells.items()
+            ],
+            "temperatures": [
+                [temperature, mean.mean, mean.count]
+                for temperature, mean in self._temperatures.items()
+            ],
+            "overall": [self._overall.mean, self._overall.count],
+        }
+
+    def restore(self, data: dict):
+        self._cells = {
+            (temperature, speed): _Mean(mean, count)
+            for temperature, speed, mean, count in data["cells"]
+        }
+        self._temperatures = {
+            temperature: _Mean(mean, count)
+            for temperature, mean, count in data["temperatures"]
+        }
+        self._overall = _Mean(*data["overall"])
@@ -0,0 +1,70 @@
+"""Token-bucket rate limiting of requests towards the Fisker servers."""
+
+import asyncio
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket that makes callers wait for a token instead of failing.
+
+    Priority callers (commands) are served before anyone else waiting.
+    """
+
+    def __init__(self, name: str, rate: float, capacity: int):
+        self.name = name
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._priority_waiting = 0
+
+        # Metrics
+        self.requests = 0
+        self.throttled = 0
+        self.waited = 0.0
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    async def acquire(self, priority: bool = False):
+        """Take a token, waiting until one is available."""
+        started = time.monotonic()
+        throttled = False
+
+        if priority:
+            self._priority_waiting += 1
+        try:
+            while True:
+                self._refill()
+                if self._tokens >= 1 and (priority or self._priority_waiting == 0):
+                    self._tokens -= 1
+                    break
+
+                throttled = True
+                await asyncio.sleep(max((1 - self._tokens) / self._rate, 0.05))
+        finally:
+            if priority:
+                self._priority_waiting -= 1
+
+        self.requests += 1
+        if throttled:
+            self.throttled += 1
+            self.waited += time.monotonic() - started
+            _LOGGER.debug(
+                f"{self.name} request throttled for {time.monotonic() - started:.1f}s"
+            )
+
+    def as_dict(self) -> dict:
+        """Return the metrics of the bucket."""
+        return {
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "waited_seconds": round(self.waited, 1),
+        }
@@ -0,0 +1,107 @@
+"""Central scheduler spreading coordinator refreshes over the whole fleet."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import timedelta
+import heapq
+import itertools
+import logging
+import time
+
+from .const import MAX_CONCURRENT_SESSIONS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Vehicles that are driving or charging are served before parked ones
+PRIORITY_ACTIVE = 0
+PRIORITY_IDLE = 1
+
+# Fractional part of the golden ratio, spreads any number of slots evenly
+_GOLDEN_RATIO = 0.6180339887498949
+
+
+class FiskerScheduler:
+    """Stagger polls and cap the number of gateway sessions in flight."""
+
+    def __init__(self, max_sessions: int = MAX_CONCURRENT_SESSIONS):
+        self._available = max_sessions
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._slots: dict[str, int] = {}
+        self._next_slot = itertools.count()
+        self.in_flight = 0
+
+    def async_register(self, name: str):
+        """Give an account a fixed slot in the polling interval."""
+        if name not in self._slots:
+            self._slots[name] = next(self._next_slot)
+
+    def async_unregister(self, name: str):
+        """Forget an account."""
+        self._slots.pop(name, None)
+
+    def stagger_offset(self, name: str, interval: timedelta) -> timedelta:
+        """Return the offset of an account's polls within the interval.
+
+        Slots follow a golden-ratio sequence, so the polls are evenly spread
+        however many accounts end up registered.
+        """
+        slot = self._slots.get(name, 0)
+        return interval * ((slot * _GOLDEN_RATIO) % 1)
+
+    def next_poll(
+        self, name: str, interval: timedelta, now: float | None = None
+    ) -> timedelta:
+        """Return the delay until an account's next poll.
+
+        Polls land on a fixed grid of the interval, shifted by the account's
+        offset, so they stay spread whenever the interval changes. A grid
+        point less than half an interval away is skipped, a poll that ran a
+        little early does not poll again right after.
+        """
+        seconds = interval.total_seconds()
+        if seconds <= 0:
+            return interval
+
+        # The event loop schedules on the monotonic clock as well
+        if now is None:
+            now = time.monotonic()
+        offset = self.stagger_offset(name, interval).total_seconds()
+        delay = seconds - (now - offset) % seconds
+        if delay < seconds / 2:
+            delay += seconds
+        return timedelta(seconds=delay)
+
+    @asynccontextmanager
+    async def session(self, priority: int = PRIORITY_IDLE):
+        """Wait for a free gateway session, highest priority first."""
+        await self._acquire(priority)
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._release()
+
+    async def _acquire(self, priority: int):
+        if self._available > 0 and not self._waiters:
+            self._available -= 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # The slot was handed over just before the cancellation, pass it on
+            if not waiter.cancelled():
+                self._release()
+            raise
+
+    def _release(self):
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._available += 1
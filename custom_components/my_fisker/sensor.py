@@ -13,28 +13,32 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import FiskerBaseEntity, FiskerSensorEntityDescription, MyFiskerCoordinator
+from .analytics import efficiency_at
+from .catalog import partition_snapshot
 from .const import (
-    CAR_SETTINGS,
     CLIMATE_CONTROL_SEAT_HEAT,
+    CONF_DEADBAND_PREFIX,
     DEVICE_MANUCFACTURER,
     DEVICE_MODEL,
     DOMAIN,
     LIST_CLIMATE_CONTROL_SEAT_HEAT,
-    PROFILES,
-    TRIM_EXTREME_ULTRA_BATT_CAPACITY,
-    TRIM_SPORT_BATT_CAPACITY,
 )
 from .entities_sensor import (
+    SENSORS_ANALYTICS,
     SENSORS_CAR_SETTINGS,
-    SENSORS_DIGITAL_TWIN,
+    SENSORS_CHARGE_RATE,
+    SENSORS_PREDICTED_RANGE,
+    SENSORS_VEHICLE_STATE,
     SENSORS_ChargeStat,
     SENSORS_tripSTAT,
 )
+from .statemachine import STATE_CHARGING, STATES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,9 +52,11 @@ class FiskerSensor(FiskerBaseEntity, CoordinatorEntity, SensorEntity):
         idx,
         sensor: FiskerSensorEntityDescription,
         client,
+        deadband: float = None,
     ):
         """Initialize My Fisker vehicle sensor."""
-        super().__init__(client._coordinator, idx)
+        super().__init__(coordinator, idx)
+        self._deadband = deadband
 
         self.idx = idx
         # self._sensor = sensor
@@ -69,18 +75,13 @@ class FiskerSensor(FiskerBaseEntity, CoordinatorEntity, SensorEntity):
         elif "seat_heat" in self.entity_description.key:
             self._attr_options = LIST_CLIMATE_CONTROL_SEAT_HEAT
             self._attr_device_class = SensorDeviceClass.ENUM
+        elif self.entity_description.key == "vehicle_state":
+            self._attr_options = STATES
+            self._attr_device_class = SensorDeviceClass.ENUM
 
     @property
     def battery_capacity(self):
-        # VCF1Z = One, VCF1E = Extreme, VCF1U = Ultra VCF1S = Sport
-        trim_extreme_ultra = ["VCF1Z", "VCF1E", "VCF1U"]
-        trim_sport = ["VCF1s"]
-        if self.vin[0:5] in trim_extreme_ultra:
-            return TRIM_EXTREME_ULTRA_BATT_CAPACITY
-        if self.vin[0:5] in trim_sport:
-            return TRIM_SPORT_BATT_CAPACITY
-        else:
-            return 0
+        return self._coordinator.battery_capacity
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -94,9 +95,6 @@ class FiskerSensor(FiskerBaseEntity, CoordinatorEntity, SensorEntity):
 
         data_available = False
 
-        self.update_chargestats()
-        self.update_tripstats()
-
         if "car_settings" in self.entity_description.key:
             try:
                 value = self.handle_carsettings(self.entity_description.key)
@@ -113,6 +111,24 @@ class FiskerSensor(FiskerBaseEntity, CoordinatorEntity, SensorEntity):
                 self.entity_description.key
             )
 
+        elif "analytics" in self.entity_description.key:
+            self._attr_native_value = self.handle_analytics(self.entity_description.key)
+            data_available = self._attr_native_value is not None
+
+        elif "chargerate" in self.entity_description.key:
+            self._attr_native_value = self.handle_chargerate(
+                self.entity_description.key
+            )
+            data_available = self._attr_native_value is not None
+
+        elif "predicted_range" in self.entity_description.key:
+            self._attr_native_value = self._coordinator.predicted_range
+            data_available = self._attr_native_value is not None
+
+        elif self.entity_description.key == "vehicle_state":
+            self._attr_native_value = self._coordinator.state_machine.state
+            data_available = self._attr_native_value is not None
+
         else:
             value = self._coordinator.data[self.idx[1]]
             data_available = True
@@ -126,11 +142,27 @@ class FiskerSensor(FiskerBaseEntity, CoordinatorEntity, SensorEntity):
                 local_time = utc_time + self._coordinator.time_difference_from_utc
                 self._attr_native_value = local_time.strftime("%Y-%m-%d %H:%M:%S")
             else:
+                value = self.entity_description.quantize(value)
+                if self._attr_available and self.within_deadband(value):
+                    # Keep the written state, jitter is not worth a state write
+                    return
                 self._attr_native_value = value
 
         self._attr_available = data_available
         self.async_write_ha_state()
 
+    def within_deadband(self, value) -> bool:
+        """Whether value is too close to the written state to be worth writing."""
+        previous = self._attr_native_value
+        if (
+            not self._deadband
+            or isinstance(value, bool)
+            or not isinstance(value, (int, float))
+            or not isinstance(previous, (int, float))
+        ):
+            return False
+        return abs(value - previous) < self._deadband
+
     @property
     def should_poll(self):
         return False
@@ -152,9 +184,9 @@ class FiskerSensor(FiskerBaseEntity, CoordinatorEntity, SensorEntity):
     def extra_state_attributes(self):
         if self.entity_description.key == "vin":
             attributes = {}
-            attributes["BLE key"] = self._coordinator.my_fisker_api.data[PROFILES][
-                "0_ble_key"
-            ]
+            attributes["BLE key"] = self._coordinator.my_fisker_api.GetProfile(
+                self.vin
+            ).get("ble_key")
             return attributes
         else:
             None
@@ -162,7 +194,7 @@ class FiskerSensor(FiskerBaseEntity, CoordinatorEntity, SensorEntity):
     def handle_carsettings(self, key):
         value = "n/a"
 
-        carSetting = self._coordinator.my_fisker_api.data[CAR_SETTINGS]
+        carSetting = self._coordinator.my_fisker_api.car_settings[self.vin]
         value = self.entity_description.get_car_settings_value(carSetting)
 
         if "_updated" in key:
@@ -231,139 +263,31 @@ class FiskerSensor(FiskerBaseEntity, CoordinatorEntity, SensorEntity):
 
         return value
 
-    def update_tripstats(self):
-        carStartedDriving = False
-        carIsDriving = False
-        carEndedDriving = False
-
-        if self._coordinator.tripstats.vehicleParked is True:
-            if (
-                self._coordinator.tripstats.vehicleParked
-                != self._coordinator.data["gear_in_park"]
-            ):
-                # _LOGGER.info("carStartedDriving")
-                carStartedDriving = True
+    def handle_analytics(self, key):
+        analytics = self._coordinator.analytics
+        if not analytics:
+            return None
 
-        if (
-            self._coordinator.tripstats.vehicleParked is False
-            and self._coordinator.data["gear_in_park"] is False
-        ):
-            # _LOGGER.info("carIsDriving")
-            carIsDriving = True
+        if "_temperature" in key:
+            return efficiency_at(
+                analytics,
+                self._coordinator.data.get("climate_control_ambient_temperature"),
+            )
 
-        if (
-            self._coordinator.tripstats.vehicleParked is False
-            and self._coordinator.data["gear_in_park"] is True
-        ):
-            # _LOGGER.info("carEndedDriving")
-            carEndedDriving = True
-
-        self._coordinator.tripstats.vehicleParked = self._coordinator.data[
-            "gear_in_park"
-        ]
-
-        if carStartedDriving:
-            self._coordinator.tripstats.Clear()
-
-            # Get battery info
-            if "battery_percent" in self.entity_description.key:
-                self._coordinator.tripstats.add_battery(
-                    self._coordinator.data[self.idx[1]]
-                )
-            # Get distance info
-            if "battery_total_mileage_odometer" in self.entity_description.key:
-                self._coordinator.tripstats.add_distance(
-                    self._coordinator.data[self.idx[1]]
-                )
-
-        if carIsDriving:
-            # Get battery info
-            if "battery_percent" in self.entity_description.key:
-                prevBatt = self._attr_native_value
-
-                # Save battery info
-                if prevBatt != self._coordinator.data[self.idx[1]]:
-                    self._coordinator.tripstats.add_battery(
-                        self._coordinator.data[self.idx[1]]
-                    )
-
-            # Get distance info
-            if "battery_total_mileage_odometer" in self.entity_description.key:
-                prevDist = self._attr_native_value
-
-                # Save distance info
-                if prevDist != self._coordinator.data[self.idx[1]]:
-                    self._coordinator.tripstats.add_distance(
-                        self._coordinator.data[self.idx[1]]
-                    )
-
-        elif carEndedDriving:
-            pass
-
-    def update_chargestats(self):
-        carIsCharging = False
-        carEndedCharging = False
-
-        if self._coordinator.chargestats.carIsRunning is False:
-            carIsCharging = True
-
-        if carIsCharging:
-            if "Initial_value" in self._coordinator.data["battery_charge_type"]:
-                carIsCharging = False
-                carEndedCharging = True
-
-        # Remember if vehicle is 'charging' and/or 'parked'
-        self._coordinator.chargestats.carIsRunning = (
-            "charging" not in self._coordinator.data["battery_charge_type"]
-        )
-        self._coordinator.chargestats.vehicleParked = self._coordinator.data[
-            "gear_in_park"
-        ]
-
-        if carEndedCharging:
-            self._coordinator.chargestats.Clear()
-
-            # Get battery info
-            if "battery_percent" in self.entity_description.key:
-                self._coordinator.chargestats.add_battery(
-                    self._coordinator.data[self.idx[1]]
-                )
-
-            # Get distance info
-            if "battery_total_mileage_odometer" in self.entity_description.key:
-                self._coordinator.chargestats.add_distance(
-                    self._coordinator.data[self.idx[1]]
-                )
-
-        if carIsCharging is False:
-            # Get battery info
-            if "battery_percent" in self.entity_description.key:
-                prevBatt = self._attr_native_value
-
-                # Save battery info
-                if prevBatt != self._coordinator.data[self.idx[1]]:
-                    self._coordinator.chargestats.add_battery(
-                        self._coordinator.data[self.idx[1]]
-                    )
-
-            # Get distance info
-            if "battery_total_mileage_odometer" in self.entity_description.key:
-                prevDist = self._attr_native_value
-
-                # Save distance info
-                if prevDist != self._coordinator.data[self.idx[1]]:
-                    self._coordinator.chargestats.add_distance(
-                        self._coordinator.data[self.idx[1]]
-                    )
-        else:
-            pass
+        return analytics["efficiency"]
 
+    def handle_chargerate(self, key):
+        if self._coordinator.state_machine.state != STATE_CHARGING:
+            return None
 
-# Get an item by its key
-def get_sensor_by_key(key):
-    for sensor in SENSORS_DIGITAL_TWIN:
-        if sensor.key == key:
-            return sensor
+        estimator = self._coordinator.charge_rate
+        if "_power" in key:
+            return estimator.power(self.battery_capacity)
+        if "_to_80" in key:
+            return estimator.minutes_to(80)
+        if "_to_100" in key:
+            return estimator.minutes_to(100)
+        return None
 
 
 async def async_setup_entry(
@@ -373,30 +297,49 @@ async def async_setup_entry(
 
     my_Fisker_data = hass.data[DOMAIN][entry.entry_id]
 
-    coordinator = my_Fisker_data._coordinator
-
     entities: list[FiskerSensor] = []
 
-    # for sensor in SENSORS:
-    for idx in enumerate(coordinator.data):
-        sens = get_sensor_by_key(idx[1])
-        if sens is None:
-            _LOGGER.warning(idx[1])
-        else:
-            entities.append(FiskerSensor(coordinator, idx, sens, my_Fisker_data))
-
-    entities.extend(
-        FiskerSensor(coordinator, 100, sensor, my_Fisker_data)
-        for sensor in SENSORS_CAR_SETTINGS
-    )
-    entities.extend(
-        FiskerSensor(coordinator, 200, sensor, my_Fisker_data)
-        for sensor in SENSORS_tripSTAT
-    )
-    entities.extend(
-        FiskerSensor(coordinator, 300, sensor, my_Fisker_data)
-        for sensor in SENSORS_ChargeStat
-    )
+    for coordinator in my_Fisker_data.coordinators.values():
+        platforms, _ = partition_snapshot(coordinator)
+        entities.extend(
+            FiskerSensor(
+                coordinator,
+                idx,
+                sens,
+                my_Fisker_data,
+                entry.options.get(CONF_DEADBAND_PREFIX + sens.key, sens.deadband),
+            )
+            for idx, sens in platforms[Platform.SENSOR]
+        )
+
+        entities.extend(
+            FiskerSensor(coordinator, 100, sensor, my_Fisker_data)
+            for sensor in SENSORS_CAR_SETTINGS
+        )
+        entities.extend(
+            FiskerSensor(coordinator, 200, sensor, my_Fisker_data)
+            for sensor in SENSORS_tripSTAT
+        )
+        entities.extend(
+            FiskerSensor(coordinator, 300, sensor, my_Fisker_data)
+            for sensor in SENSORS_ChargeStat
+        )
+        entities.extend(
+            FiskerSensor(coordinator, 400, sensor, my_Fisker_data)
+            for sensor in SENSORS_ANALYTICS
+        )
+        entities.extend(
+            FiskerSensor(coordinator, 500, sensor, my_Fisker_data)
+            for sensor in SENSORS_CHARGE_RATE
+        )
+        entities.extend(
+            FiskerSensor(coordinator, 600, sensor, my_Fisker_data)
+            for sensor in SENSORS_PREDICTED_RANGE
+        )
+        entities.extend(
+            FiskerSensor(coordinator, 700, sensor, my_Fisker_data)
+            for sensor in SENSORS_VEHICLE_STATE
+        )
 
     # Add entities to Home Assistant
     async_add_entities(entities)
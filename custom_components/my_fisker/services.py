@@ -0,0 +1,180 @@
+"""Services of the My Fisker integration."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .analytics import summarize_store
+from .const import DOMAIN, TRIP_QUERY_LIMIT
+from .statemachine import STATE_CHARGING
+from .tripstore import KINDS
+
+ATTR_VIN = "vin"
+
+SERVICE_GET_TRIPS = "get_trips"
+GET_TRIPS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_VIN): cv.string,
+        vol.Optional("start"): cv.datetime,
+        vol.Optional("end"): cv.datetime,
+        vol.Optional("kind"): vol.In(list(KINDS)),
+        vol.Optional("limit", default=TRIP_QUERY_LIMIT): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+    }
+)
+
+SERVICE_GET_TRIP_ANALYTICS = "get_trip_analytics"
+GET_TRIP_ANALYTICS_SCHEMA = vol.Schema({vol.Optional(ATTR_VIN): cv.string})
+
+SERVICE_GET_SNAPSHOT = "get_snapshot"
+GET_SNAPSHOT_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_VIN): cv.string,
+        vol.Optional("fields"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("max_age"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    }
+)
+
+
+@callback
+def async_get_coordinator(hass: HomeAssistant, vin: str | None):
+    """Return the coordinator of a VIN, the VIN may be left out with a single vehicle."""
+    coordinators = {}
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        my_Fisker_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+        if my_Fisker_data is not None:
+            coordinators.update(my_Fisker_data.coordinators)
+
+    if vin is None:
+        if len(coordinators) != 1:
+            raise HomeAssistantError("More than one Fisker set up, a VIN is required")
+        return next(iter(coordinators.values()))
+
+    if vin not in coordinators:
+        raise HomeAssistantError(f"No Fisker with VIN {vin}")
+    return coordinators[vin]
+
+
+def _snapshot(coordinator, fields: list[str] | None) -> dict:
+    """Return the twin, car settings and derived values of a vehicle in one go."""
+    data = dict(coordinator.data.items())
+
+    # Left out rather than failing the call when the gateway sent something odd
+    frame = coordinator.my_fisker_api.car_settings.get(coordinator.vin)
+    items = frame.get("data") if isinstance(frame, dict) else None
+    car_settings = {
+        item["name"]: item.get("value")
+        for item in (items if isinstance(items, list) else [])
+        if isinstance(item, dict) and "name" in item
+    }
+    capacity = coordinator.battery_capacity
+    charging = coordinator.state_machine.state == STATE_CHARGING
+    stats = {
+        "vehicle_state": coordinator.state_machine.state,
+        "zones": sorted(coordinator.zones),
+        "trip_distance": coordinator.tripstats.dist,
+        "trip_duration": coordinator.tripstats.time,
+        "trip_energy": round(coordinator.tripstats.batt * capacity / 100, 2),
+        "charge_power": coordinator.charge_rate.power(capacity) if charging else None,
+        "charge_minutes_to_80": coordinator.charge_rate.minutes_to(80)
+        if charging
+        else None,
+        "charge_minutes_to_100": coordinator.charge_rate.minutes_to(100)
+        if charging
+        else None,
+        "predicted_range": coordinator.predicted_range,
+    }
+
+    snapshot = {
+        "vin": coordinator.vin,
+        "age": round(coordinator.data_age, 1),
+    }
+    if fields:
+        # A field is a twin key, or the car_settings or stats section
+        snapshot["data"] = {key: data[key] for key in fields if key in data}
+        if "car_settings" in fields:
+            snapshot["car_settings"] = car_settings
+        if "stats" in fields:
+            snapshot["stats"] = stats
+    else:
+        snapshot.update(data=data, car_settings=car_settings, stats=stats)
+    return snapshot
+
+
+@callback
+def async_setup_services(hass: HomeAssistant):
+    """Register the My Fisker services."""
+
+    async def async_get_trips(call: ServiceCall) -> ServiceResponse:
+        coordinator = async_get_coordinator(hass, call.data.get(ATTR_VIN))
+
+        # Include trips that finished in the last moment
+        await coordinator.async_flush_trips()
+
+        # cv.datetime gives naive times, they are in Home Assistant's time
+        # zone, not the one of the host
+        start = call.data.get("start")
+        end = call.data.get("end")
+        records = await hass.async_add_executor_job(
+            coordinator.trip_store.query,
+            int(dt_util.as_local(start).timestamp()) if start else 0,
+            int(dt_util.as_local(end).timestamp()) if end else None,
+            KINDS.get(call.data.get("kind")),
+            call.data["limit"],
+        )
+        return {"trips": [record.as_dict() for record in records]}
+
+    async def async_get_trip_analytics(call: ServiceCall) -> ServiceResponse:
+        coordinator = async_get_coordinator(hass, call.data.get(ATTR_VIN))
+        await coordinator.async_flush_trips()
+        return await hass.async_add_executor_job(
+            summarize_store, coordinator.trip_store
+        )
+
+    async def async_get_snapshot(call: ServiceCall) -> ServiceResponse:
+        coordinator = async_get_coordinator(hass, call.data.get(ATTR_VIN))
+
+        # Without max_age the last snapshot is good enough
+        max_age = call.data.get("max_age")
+        if max_age is not None and (
+            coordinator.data is None or coordinator.data_age > max_age
+        ):
+            await coordinator.async_refresh()
+        if coordinator.data is None:
+            raise HomeAssistantError(f"No data from {coordinator.alias} yet")
+
+        return _snapshot(coordinator, call.data.get("fields"))
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_TRIPS,
+        async_get_trips,
+        schema=GET_TRIPS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_TRIP_ANALYTICS,
+        async_get_trip_analytics,
+        schema=GET_TRIP_ANALYTICS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_SNAPSHOT,
+        async_get_snapshot,
+        schema=GET_SNAPSHOT_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
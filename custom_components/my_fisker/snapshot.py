@@ -0,0 +1,156 @@
+"""Typed, immutable snapshot of a vehicle's digital twin."""
+
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+# Flattened digital twin keys with a fixed slot, anything else goes to extras
+FIELDS = (
+    "battery_avg_cell_temp",
+    "battery_charge_type",
+    "battery_max_miles",
+    "battery_percent",
+    "battery_remaining_charging_time",
+    "battery_remaining_charging_time_full",
+    "battery_state_of_charge",
+    "battery_total_mileage_odometer",
+    "climate_control_ambient_temperature",
+    "climate_control_cabin_temperature",
+    "climate_control_driver_seat_heat",
+    "climate_control_internal_temperature",
+    "climate_control_passenger_seat_heat",
+    "climate_control_rear_defrost",
+    "climate_control_steering_wheel_heat",
+    "door_locks_all",
+    "door_locks_driver",
+    "doors_hood",
+    "doors_left_front",
+    "doors_left_rear",
+    "doors_right_front",
+    "doors_right_rear",
+    "doors_trunk",
+    "gear_in_park",
+    "ip",
+    "location_altitude",
+    "location_latitude",
+    "location_longitude",
+    "online",
+    "online_hmi",
+    "trex_version",
+    "updated",
+    "vehicle_ready_state_is_vehicle_ready",
+    "vehicle_speed_speed",
+    "vin",
+    "windows_left_front",
+    "windows_left_rear",
+    "windows_left_rear_quarter",
+    "windows_rear_windshield",
+    "windows_right_front",
+    "windows_right_rear",
+    "windows_right_rear_quarter",
+    "windows_sunroof",
+)
+_FIELD_BITS = {name: 1 << index for index, name in enumerate(FIELDS)}
+
+
+class DigitalTwinSnapshot(Mapping):
+    """Digital twin with attribute access to the known fields.
+
+    Fields are stored in slots instead of a per-snapshot dict, a field the
+    twin did not report reads as None. The snapshot still behaves as a
+    read-only mapping of the flattened keys, so data["battery_percent"] keeps
+    working next to data.battery_percent.
+    """
+
+    __slots__ = (*FIELDS, "extras", "_present")
+
+    def __init__(self, values: Mapping[str, Any] | None = None):
+        set_field = object.__setattr__
+        for name in FIELDS:
+            set_field(self, name, None)
+        present = 0
+        extras = {}
+        for key, value in (values or {}).items():
+            bit = _FIELD_BITS.get(key)
+            if bit is None:
+                extras[key] = value
+            else:
+                set_field(self, key, value)
+                present |= bit
+        set_field(self, "extras", extras)
+        set_field(self, "_present", present)
+
+    @classmethod
+    def from_twin(cls, twin) -> "DigitalTwinSnapshot":
+        """Flatten a digital twin straight into the slots, without an intermediate dict."""
+        snapshot = cls.__new__(cls)
+        set_field = object.__setattr__
+        for name in FIELDS:
+            set_field(snapshot, name, None)
+        present = 0
+        extras = {}
+
+        def flatten(x, name=""):
+            nonlocal present
+            if type(x) is dict:
+                for a in x:
+                    flatten(x[a], name + a + "_")
+            elif type(x) is list:
+                for i, a in enumerate(x):
+                    flatten(a, name + str(i) + "_")
+            else:
+                key = name[:-1]
+                bit = _FIELD_BITS.get(key)
+                if bit is None:
+                    extras[key] = x
+                else:
+                    set_field(snapshot, key, x)
+                    present |= bit
+
+        flatten(twin)
+        set_field(snapshot, "extras", extras)
+        set_field(snapshot, "_present", present)
+        return snapshot
+
+    def replace(self, changes: Mapping[str, Any]) -> "DigitalTwinSnapshot":
+        """Return a copy with some keys changed."""
+        return DigitalTwinSnapshot({**dict(self.items()), **changes})
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DigitalTwinSnapshot is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("DigitalTwinSnapshot is immutable")
+
+    def __getitem__(self, key: str):
+        bit = _FIELD_BITS.get(key)
+        if bit is None:
+            return self.extras[key]
+        if not self._present & bit:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key) -> bool:
+        bit = _FIELD_BITS.get(key)
+        if bit is None:
+            return key in self.extras
+        return bool(self._present & bit)
+
+    def __iter__(self) -> Iterator[str]:
+        for name in FIELDS:
+            if self._present & _FIELD_BITS[name]:
+                yield name
+        yield from self.extras
+
+    def __len__(self) -> int:
+        return self._present.bit_count() + len(self.extras)
+
+    def __eq__(self, other) -> bool:
+        # An unchanged frame hands back the very same snapshot
+        if other is self:
+            return True
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"DigitalTwinSnapshot({dict(self.items())!r})"
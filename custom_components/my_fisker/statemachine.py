@@ -0,0 +1,57 @@
+"""Debounced state of a vehicle: asleep, parked, driving or charging."""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+STATE_ASLEEP = "asleep"
+STATE_PARKED = "parked"
+STATE_DRIVING = "driving"
+STATE_CHARGING = "charging"
+STATES = [STATE_ASLEEP, STATE_PARKED, STATE_DRIVING, STATE_CHARGING]
+
+
+class Transition(NamedTuple):
+    """A confirmed change of state, with the snapshot that first showed it."""
+
+    previous: str | None
+    state: str
+    since: float
+    data: object
+
+
+class VehicleStateMachine:
+    """Vehicle state that only moves once the new state is confirmed.
+
+    A new state has to be seen on debounce consecutive snapshots before the
+    machine moves to it, so a single odd snapshot does not end a trip. The
+    transition carries the first snapshot of the new state, which is where a
+    trip or charge session really started or ended.
+    """
+
+    def __init__(self, debounce: int, state: str | None = None):
+        self.state = state
+        self._debounce = debounce
+        self._candidate: Transition | None = None
+        self._seen = 0
+
+    def update(self, observed: str, since: float, data) -> Transition | None:
+        """Feed the state a snapshot shows, return the transition once confirmed."""
+        if observed == self.state:
+            self._candidate = None
+            return None
+
+        if self.state is None:
+            self.state = observed
+            return Transition(None, observed, since, data)
+
+        if self._candidate is None or self._candidate.state != observed:
+            self._candidate = Transition(self.state, observed, since, data)
+            self._seen = 0
+        self._seen += 1
+        if self._seen < self._debounce:
+            return None
+
+        transition, self._candidate = self._candidate, None
+        self.state = observed
+        return transition
@@ -85,6 +85,55 @@ class TripStats(object):
 
         return round(self._speed, 2)
 
+    def as_dict(self) -> dict:
+        """Return the state worth keeping over a restart.
+
+        Only the first and last samples of a queue are ever used, the rest is
+        left out.
+        """
+        return {
+            "carIsRunning": self.carIsRunning,
+            "vehicleParked": self.vehicleParked,
+            "qDist": [(item.value, item.timestamp) for item in _ends(self.qDist)],
+            "qBatt": [(item.value, item.timestamp) for item in _ends(self.qBatt)],
+            "batt": self._batt,
+            "time": self._time,
+            "dist": self._dist,
+            "efficiency": self._efficiency,
+            "efficiency_dist": self._efficiency_dist,
+            "speed": self._speed,
+            "previous_efficiency": self.previous_efficiency,
+        }
+
+    def restore(self, data: dict):
+        """Continue from a state saved by as_dict."""
+        self.carIsRunning = data["carIsRunning"]
+        self.vehicleParked = data["vehicleParked"]
+        self.qDist = deque(StatsItem(*item) for item in data["qDist"])
+        self.qBatt = deque(StatsItem(*item) for item in data["qBatt"])
+        self._batt = data["batt"]
+        self._time = data["time"]
+        self._dist = data["dist"]
+        self._efficiency = data["efficiency"]
+        self._efficiency_dist = data["efficiency_dist"]
+        self._speed = data["speed"]
+        self.previous_efficiency = data["previous_efficiency"]
+
+    def add_sample(self, dist, batt) -> bool:
+        """Add the odometer and battery of a snapshot, and bring the totals up to date."""
+        if dist is not None and (not self.qDist or dist != self.qDist[-1].value):
+            self.add_distance(dist)
+        if batt is not None and (not self.qBatt or batt != self.qBatt[-1].value):
+            self.add_battery(batt)
+        if not self.qDist or not self.qBatt:
+            return False
+
+        # The totals are kept as they are once the vehicle parks
+        self._time = self.qDist[-1].timestamp - self.qDist[0].timestamp
+        self._batt = self.qBatt[0].value - self.qBatt[-1].value
+        self._dist = self.qDist[-1].value - self.qDist[0].value
+        return True
+
     def add_battery(self, batt):
         item = StatsItem(batt, time.time())
         self.qBatt.append(item)
@@ -94,6 +143,12 @@ class TripStats(object):
         self.qDist.append(item)
 
 
+def _ends(queue: deque) -> list:
+    if len(queue) <= 2:
+        return list(queue)
+    return [queue[0], queue[-1]]
+
+
 class StatsItem(object):
     def __init__(self, val: float, time: time) -> None:
         self._val = val
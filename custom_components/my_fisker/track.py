@@ -0,0 +1,92 @@
+"""Distance helpers and on-the-fly compression of a driven track."""
+
+import math
+
+EARTH_RADIUS = 6371008.8
+
+
+def distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points, in meters."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    a = (
+        math.sin((phi2 - phi1) / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * math.asin(math.sqrt(a))
+
+
+def _offset(point, start, end) -> float:
+    """Distance in meters from point to the segment start-end.
+
+    Uses a local flat projection around start, which is plenty for the few
+    hundred meters between two kept track points.
+    """
+    scale = math.radians(1) * EARTH_RADIUS
+    cos_lat = math.cos(math.radians(start[0]))
+
+    px = (point[1] - start[1]) * cos_lat * scale
+    py = (point[0] - start[0]) * scale
+    ex = (end[1] - start[1]) * cos_lat * scale
+    ey = (end[0] - start[0]) * scale
+
+    length = ex * ex + ey * ey
+    if length == 0:
+        return math.hypot(px, py)
+    t = max(0.0, min(1.0, (px * ex + py * ey) / length))
+    return math.hypot(px - t * ex, py - t * ey)
+
+
+class TrackCompressor:
+    """Streaming Douglas-Peucker simplification of a track.
+
+    Points since the last kept point are held in a small window. A point is
+    only kept once a straight line from the last kept point no longer covers
+    the window within the tolerance. The window is bounded, so a straight
+    road costs one point per window of samples and each sample O(window).
+    """
+
+    def __init__(self, tolerance: float, max_points: int, window: int = 32):
+        self.tolerance = tolerance
+        self.max_points = max_points
+        self._window_size = window
+        self._kept: list[tuple[float, float]] = []
+        self._window: list[tuple[float, float]] = []
+
+    def clear(self):
+        self._kept.clear()
+        self._window.clear()
+
+    def add(self, latitude: float, longitude: float):
+        point = (latitude, longitude)
+        if not self._kept:
+            self._kept.append(point)
+            return
+
+        anchor = self._kept[-1]
+        if len(self._window) >= self._window_size or any(
+            _offset(p, anchor, point) > self.tolerance for p in self._window
+        ):
+            # Make room first, the kept points and the latest position
+            # together never exceed max_points
+            if len(self._kept) + 2 > self.max_points:
+                self._thin()
+            # The previous point ends the straight part, it becomes the new anchor
+            self._kept.append(self._window[-1])
+            self._window = [point]
+        else:
+            self._window.append(point)
+
+    def _thin(self):
+        # Out of room, drop every other point in the older half of the track.
+        # At least one point goes, however short the track.
+        half = max(len(self._kept) // 2, 2)
+        self._kept = self._kept[:half:2] + self._kept[half:]
+
+    @property
+    def points(self) -> list[tuple[float, float]]:
+        """Kept points plus the latest position."""
+        return self._kept + self._window[-1:]
+
+    def __len__(self) -> int:
+        return len(self.points)
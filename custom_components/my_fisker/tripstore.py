@@ -0,0 +1,149 @@
+"""Append-only on-disk history of finished trips and charge sessions."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import logging
+import os
+import struct
+import threading
+from typing import Iterator, NamedTuple
+
+_LOGGER = logging.getLogger(__name__)
+
+KIND_TRIP = 0
+KIND_CHARGE = 1
+KINDS = {"trip": KIND_TRIP, "charge": KIND_CHARGE}
+
+# kind, start, end, odometer start/end, battery % start/end, energy,
+# efficiency, ambient temperature, average speed
+RECORD = struct.Struct("<B3xII8f")
+
+# Records read per chunk when scanning a range
+_CHUNK = 256
+
+
+class TripRecord(NamedTuple):
+    """A finished trip or charge session.
+
+    Times are UTC epoch seconds, energy is kWh used (trip) or added (charge)
+    and efficiency is kWh/100km.
+    """
+
+    kind: int
+    start: int
+    end: int
+    odometer_start: float
+    odometer_end: float
+    battery_start: float
+    battery_end: float
+    energy: float
+    efficiency: float
+    ambient_temperature: float
+    average_speed: float
+
+    def as_dict(self) -> dict:
+        """Return the record as service response data."""
+        record = self._asdict()
+        record["kind"] = "charge" if self.kind == KIND_CHARGE else "trip"
+        record["start"] = datetime.fromtimestamp(self.start, timezone.utc).isoformat()
+        record["end"] = datetime.fromtimestamp(self.end, timezone.utc).isoformat()
+        for key in record:
+            if isinstance(record[key], float):
+                record[key] = round(record[key], 2)
+        return record
+
+
+class TripStore:
+    """Fixed-width records in an append-only file, oldest first.
+
+    Records are buffered and written in batches. Once the file outgrows
+    max_bytes it is rotated to a single .1 backup, so the history is capped
+    at about twice that size. Records are ordered by end time, a range query
+    binary searches the file and only reads the records it returns.
+
+    All file access blocks, call it from the executor.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._pending: list[TripRecord] = []
+        self._lock = threading.Lock()
+
+    def append(self, record: TripRecord):
+        self._pending.append(record)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def flush(self) -> list[TripRecord]:
+        """Write the buffered records, and return them."""
+        records, self._pending = self._pending, []
+        if not records:
+            return records
+
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            try:
+                if os.path.getsize(self.path) >= self.max_bytes:
+                    os.replace(self.path, self.path + ".1")
+            except FileNotFoundError:
+                pass
+
+            with open(self.path, "ab") as file:
+                file.write(b"".join(RECORD.pack(*record) for record in records))
+
+        _LOGGER.debug("Wrote %d records to %s", len(records), self.path)
+        return records
+
+    def query(
+        self,
+        start: int = 0,
+        end: int | None = None,
+        kind: int | None = None,
+        limit: int | None = None,
+    ) -> list[TripRecord]:
+        """Return the records that ended within [start, end], oldest first."""
+        result = []
+        with self._lock:
+            for path in (self.path + ".1", self.path):
+                for record in self._scan(path, start):
+                    if end is not None and record.end > end:
+                        return result
+                    if kind is not None and record.kind != kind:
+                        continue
+                    result.append(record)
+                    if limit is not None and len(result) >= limit:
+                        return result
+        return result
+
+    def _scan(self, path: str, start: int) -> Iterator[TripRecord]:
+        try:
+            file = open(path, "rb")
+        except FileNotFoundError:
+            return
+
+        with file:
+            count = os.fstat(file.fileno()).st_size // RECORD.size
+
+            def end_at(index):
+                file.seek(index * RECORD.size)
+                return RECORD.unpack(file.read(RECORD.size))[2]
+
+            # First record that ended at or after start
+            low, high = 0, count
+            while low < high:
+                mid = (low + high) // 2
+                if end_at(mid) < start:
+                    low = mid + 1
+                else:
+                    high = mid
+
+            file.seek(low * RECORD.size)
+            while chunk := file.read(_CHUNK * RECORD.size):
+                for values in RECORD.iter_unpack(
+                    chunk[: len(chunk) - len(chunk) % RECORD.size]
+                ):
+                    yield TripRecord(*values)
@@ -0,0 +1,135 @@
+"""WebSocket API streaming digital twin changes to dashboards."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later
+
+from .const import SIGNAL_COORDINATOR_UNLOADED, WS_SUBSCRIBE_INTERVAL
+from .services import async_get_coordinator
+
+_MISSING = object()
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant):
+    """Register the My Fisker WebSocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+class _Subscription:
+    """Send a subscriber the keys that changed since its last message.
+
+    The first message holds the whole snapshot. After that at most one
+    message goes out per interval, snapshots in between are merged so only
+    the latest value of a key is sent, and a key that changed back is not
+    sent at all. A slow dashboard gets fewer, bigger messages instead of a
+    growing queue. The subscription ends with an error when the vehicle is
+    unloaded, e.g. by a reload after an options change, so the dashboard
+    knows to subscribe again.
+    """
+
+    def __init__(self, hass: HomeAssistant, connection, msg_id: int, coordinator):
+        self._hass = hass
+        self._connection = connection
+        self._msg_id = msg_id
+        self._coordinator = coordinator
+        self._sent: dict[str, Any] = {}
+        self._pending: dict[str, Any] = {}
+        self._last_message = 0.0
+        self._unsub_timer = None
+        self._unsub_listener = coordinator.async_add_listener(self.async_updated)
+        self._unsub_unloaded = async_dispatcher_connect(
+            hass, SIGNAL_COORDINATOR_UNLOADED, self._async_unloaded
+        )
+
+    @callback
+    def async_unsubscribe(self):
+        self._unsub_listener()
+        self._unsub_unloaded()
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @callback
+    def _async_unloaded(self, coordinator):
+        if coordinator is not self._coordinator:
+            return
+
+        self._connection.subscriptions.pop(self._msg_id, None)
+        self.async_unsubscribe()
+        self._connection.send_message(
+            websocket_api.error_message(
+                self._msg_id,
+                websocket_api.ERR_NOT_FOUND,
+                f"{coordinator.alias} was unloaded, subscribe again",
+            )
+        )
+
+    @callback
+    def async_updated(self):
+        data = self._coordinator.data
+        if data is None:
+            return
+
+        for key, value in data.items():
+            if self._sent.get(key, _MISSING) != value:
+                self._pending[key] = value
+            else:
+                self._pending.pop(key, None)
+
+        if not self._pending or self._unsub_timer is not None:
+            return
+        delay = self._last_message + WS_SUBSCRIBE_INTERVAL - time.monotonic()
+        if delay > 0:
+            self._unsub_timer = async_call_later(self._hass, delay, self._async_send)
+        else:
+            self._async_send()
+
+    @callback
+    def _async_send(self, _now=None):
+        self._unsub_timer = None
+        if not self._pending:
+            return
+
+        changed, self._pending = self._pending, {}
+        self._sent.update(changed)
+        self._last_message = time.monotonic()
+        self._connection.send_message(
+            websocket_api.event_message(
+                self._msg_id, {"vin": self._coordinator.vin, "changed": changed}
+            )
+        )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "my_fisker/subscribe",
+        vol.Optional("vin"): str,
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+):
+    """Subscribe to the changed digital twin keys of a vehicle."""
+    try:
+        coordinator = async_get_coordinator(hass, msg.get("vin"))
+    except HomeAssistantError as err:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, str(err))
+        return
+
+    subscription = _Subscription(hass, connection, msg["id"], coordinator)
+    connection.subscriptions[msg["id"]] = subscription.async_unsubscribe
+    connection.send_result(msg["id"])
+
+    # Start off with the whole snapshot
+    subscription.async_updated()
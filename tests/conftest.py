@@ -0,0 +1,22 @@
+"""Test setup for the parts of My Fisker that run without Home Assistant.
+
+The package __init__ sets up the Home Assistant integration. The API client,
+scheduler and stores only use relative imports of each other, so the package
+is registered by path here and its modules are imported without running
+__init__.
+"""
+
+from pathlib import Path
+import sys
+import types
+
+ROOT = Path(__file__).parents[1] / "custom_components"
+
+for name, path in (
+    ("custom_components", ROOT),
+    ("custom_components.my_fisker", ROOT / "my_fisker"),
+):
+    if name not in sys.modules:
+        module = types.ModuleType(name)
+        module.__path__ = [str(path)]
+        sys.modules[name] = module
@@ -0,0 +1,479 @@
+"""MyFiskerAPI against a local stand-in for the Fisker gateway."""
+
+import asyncio
+from datetime import timedelta
+import json
+import time
+import types
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+
+from custom_components.my_fisker import api as api_module
+from custom_components.my_fisker.api import (
+    MyFiskerAPI,
+    MyFiskerConnectionRegistry,
+    RequestConnectionError,
+    RequestTimeoutError,
+)
+from custom_components.my_fisker.const import (
+    MAX_CONCURRENT_SESSIONS,
+    WS_RECONNECT_ATTEMPTS,
+)
+from custom_components.my_fisker.scheduler import (
+    PRIORITY_ACTIVE,
+    PRIORITY_IDLE,
+    FiskerScheduler,
+)
+
+VIN = "VCF1ZBU27PG000001"
+
+
+class StubGateway:
+    """Auth endpoint and WebSocket gateway serving a twin per VIN.
+
+    Every account logs in with its username as password, the token names the
+    account so the gateway knows which VINs it may serve.
+    """
+
+    def __init__(
+        self,
+        accounts: dict[str, list[str]],
+        car_settings: dict[str, list[dict]] | None = None,
+    ):
+        self.accounts = accounts
+        # Settings sent ahead of the twin of a VIN, the frame does not name the VIN
+        self.car_settings = car_settings or {}
+        # Connections that answer verify and then never send another frame
+        self.silent_connections = 0
+        self.answer_pings = True
+        # Seconds a twin takes to arrive
+        self.twin_delay = 0.0
+        self.connections = 0
+        self.twin_requests: list[str] = []
+        self.commands: list[str] = []
+        # Poll sessions open at once, a live socket only sending commands is none
+        self.open = 0
+        self.peak_open = 0
+
+        app = web.Application()
+        app.router.add_post("/auth/login", self._login)
+        app.router.add_get("/mobile", self._websocket)
+        self.server = TestServer(app)
+
+    async def __aenter__(self):
+        await self.server.start_server()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.server.close()
+
+    def url(self, path: str) -> str:
+        return str(self.server.make_url(path))
+
+    async def _login(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        return web.json_response(
+            {
+                "accessToken": f"token-{form['username']}",
+                "accessExpiration": int(time.time()) + 2 * 86400,
+                "refreshToken": "refresh",
+            }
+        )
+
+    async def _websocket(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse(autoping=self.answer_pings)
+        await ws.prepare(request)
+        self.connections += 1
+        polling = False
+        silent = self.silent_connections > 0
+        if silent:
+            self.silent_connections -= 1
+
+        vins: list[str] = []
+        try:
+            async for msg in ws:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    continue
+                message = json.loads(msg.data)
+                handler = message["handler"]
+
+                if handler == "verify":
+                    vins = self.accounts[message["data"]["token"][len("token-") :]]
+                    await ws.send_json(
+                        {"handler": "verify", "data": {"authenticated": True}}
+                    )
+                    continue
+                if silent:
+                    continue
+
+                if handler == "remote_command":
+                    self.commands.append(message["data"]["command"])
+                    await ws.send_json(
+                        {
+                            "handler": "remote_command",
+                            "data": {**message["data"], "status": "success"},
+                        }
+                    )
+                    continue
+
+                if not polling:
+                    polling = True
+                    self.open += 1
+                    self.peak_open = max(self.peak_open, self.open)
+
+                if handler == "profiles":
+                    await ws.send_json(
+                        {"handler": "profiles", "data": [{"vin": vin} for vin in vins]}
+                    )
+                elif handler == "digital_twin":
+                    vin = message["data"]["vin"]
+                    assert vin in vins, "twin requested for a VIN of another account"
+                    self.twin_requests.append(vin)
+                    await asyncio.sleep(self.twin_delay)
+                    if vin in self.car_settings:
+                        await ws.send_json(
+                            {"handler": "car_settings", "data": self.car_settings[vin]}
+                        )
+                    await ws.send_json(
+                        {
+                            "handler": "digital_twin",
+                            "data": {"vin": vin, "battery": {"percent": 80}},
+                        }
+                    )
+        finally:
+            if polling:
+                self.open -= 1
+        return ws
+
+
+@pytest.fixture
+def gateway_urls(monkeypatch):
+    """Point the API at a gateway, returns a function taking the gateway."""
+
+    def use(gateway: StubGateway):
+        monkeypatch.setattr(api_module, "URL_TOKEN", gateway.url("/auth/login"))
+        monkeypatch.setattr(api_module, "URL_WSS_EU", gateway.url("/mobile"))
+
+    return use
+
+
+async def _logged_in(username: str, **kwargs) -> MyFiskerAPI:
+    api = MyFiskerAPI(username, username, "EU", **kwargs)
+    await api.GetAuthTokenAsync()
+    return api
+
+
+def test_digital_twin(gateway_urls):
+    async def run():
+        async with StubGateway({"owner": [VIN]}) as gateway:
+            gateway_urls(gateway)
+            api = await _logged_in("owner")
+
+            twin = await api.GetDigitalTwin(VIN)
+
+            assert twin.vin == VIN
+            assert twin.battery_percent == 80
+            assert gateway.connections == 1
+
+    asyncio.run(run())
+
+
+def test_unchanged_twin_is_not_decoded(gateway_urls, monkeypatch):
+    """A byte-identical twin costs a digest, a changed one a single decode."""
+    decoded = []
+
+    def loads(response):
+        decoded.append(json.loads(response))
+        return decoded[-1]
+
+    monkeypatch.setattr(
+        api_module, "json", types.SimpleNamespace(loads=loads, dumps=json.dumps)
+    )
+
+    async def run():
+        async with StubGateway({"owner": [VIN]}) as gateway:
+            gateway_urls(gateway)
+            api = await _logged_in("owner")
+
+            first = await api.GetDigitalTwin(VIN)
+            second = await api.GetDigitalTwin(VIN)
+
+            assert second is first
+            assert api.skipped_frames == 1
+            assert gateway.twin_requests == [VIN, VIN]
+            twins = [
+                message for message in decoded if message["handler"] == "digital_twin"
+            ]
+            assert len(twins) == 1
+
+    asyncio.run(run())
+
+
+def test_silent_gateway_times_out(gateway_urls):
+    """A socket that stops sending fails after the receive deadline, not never."""
+
+    async def run():
+        async with StubGateway({"owner": [VIN]}) as gateway:
+            gateway_urls(gateway)
+            api = await _logged_in("owner", receive_timeout=0.2)
+            gateway.silent_connections = WS_RECONNECT_ATTEMPTS
+
+            start = time.monotonic()
+            with pytest.raises(RequestTimeoutError):
+                await api.GetDigitalTwin(VIN)
+
+            assert time.monotonic() - start < 2
+            assert gateway.connections == WS_RECONNECT_ATTEMPTS
+
+    asyncio.run(run())
+
+
+def test_silent_gateway_reconnects(gateway_urls):
+    """A stale socket is retried on a fresh connection."""
+
+    async def run():
+        async with StubGateway({"owner": [VIN]}) as gateway:
+            gateway_urls(gateway)
+            api = await _logged_in("owner", receive_timeout=0.2)
+            gateway.silent_connections = 1
+
+            twin = await api.GetDigitalTwin(VIN)
+
+            assert twin.vin == VIN
+            assert gateway.connections == 2
+
+    asyncio.run(run())
+
+
+def test_missing_pong_closes_socket(gateway_urls):
+    """The heartbeat catches a dead peer long before the receive deadline."""
+
+    async def run():
+        async with StubGateway({"owner": [VIN]}) as gateway:
+            gateway_urls(gateway)
+            api = await _logged_in("owner", heartbeat=0.2, receive_timeout=30)
+            gateway.silent_connections = WS_RECONNECT_ATTEMPTS
+            gateway.answer_pings = False
+
+            start = time.monotonic()
+            with pytest.raises(RequestConnectionError):
+                await api.GetDigitalTwin(VIN)
+
+            assert time.monotonic() - start < 5
+            assert gateway.connections == WS_RECONNECT_ATTEMPTS
+
+    asyncio.run(run())
+
+
+def test_vehicles_due_share_a_session(gateway_urls):
+    """Only vehicles polled soon ride along, a sleeping one is left alone."""
+    other = "VCF1ZBU27PG000002"
+
+    async def run():
+        async with StubGateway({"owner": [VIN, other]}) as gateway:
+            gateway_urls(gateway)
+            api = await _logged_in("owner")
+
+            # Both are new, one session fetches both
+            await api.GetDigitalTwin(VIN)
+            await api.GetDigitalTwin(other)
+            assert gateway.connections == 1
+            assert sorted(gateway.twin_requests) == [VIN, other]
+
+            # The other vehicle polls in 15 minutes
+            api.SetNextPoll(other, 900)
+            gateway.twin_requests.clear()
+            await api.GetDigitalTwin(VIN)
+            assert gateway.twin_requests == [VIN]
+
+            # Due within the batch age, fetched along and picked up from the batch
+            api.SetNextPoll(other, 5)
+            gateway.twin_requests.clear()
+            await api.GetDigitalTwin(VIN)
+            await api.GetDigitalTwin(other)
+            assert sorted(gateway.twin_requests) == [VIN, other]
+            assert gateway.connections == 3
+
+    asyncio.run(run())
+
+
+def test_car_settings_per_vehicle(gateway_urls):
+    """Car settings are kept per VIN, never handed to the wrong vehicle."""
+    other = "VCF1ZBU27PG000002"
+    settings = {
+        VIN: [
+            {"name": "BODY_COLOR", "value": "red", "updated": "2025-01-02T13:32:49Z"}
+        ],
+        other: [
+            {"name": "BODY_COLOR", "value": "blue", "updated": "2025-01-02T13:32:49Z"}
+        ],
+    }
+
+    async def run():
+        async with StubGateway({"owner": [VIN, other]}, settings) as gateway:
+            gateway_urls(gateway)
+            api = await _logged_in("owner")
+
+            # Both twins in one session, the settings cannot be told apart
+            await api.GetDigitalTwin(VIN)
+            assert api.car_settings == {}
+
+            # Asked for per vehicle, in a session of its own
+            red = await api.GetCarSettings(VIN, max_age=10)
+            blue = await api.GetCarSettings(other, max_age=10)
+            assert red["data"][0]["value"] == "red"
+            assert blue["data"][0]["value"] == "blue"
+            assert gateway.connections == 3
+
+            # A session for one vehicle brings its settings along
+            api.SetNextPoll(other, 900)
+            settings[VIN][0]["value"] = "green"
+            await api.GetDigitalTwin(VIN)
+            green = await api.GetCarSettings(VIN, max_age=10)
+            assert green["data"][0]["value"] == "green"
+            assert api.car_settings[other]["data"][0]["value"] == "blue"
+            assert gateway.connections == 4
+
+    asyncio.run(run())
+
+
+def test_accounts_share_a_pool(gateway_urls):
+    """Accounts in one region poll concurrently over one pool, each its own VINs."""
+    accounts = {
+        f"owner{account}": [f"VCF1ZBU27PG0{account:02}{car:03}" for car in range(2)]
+        for account in range(5)
+    }
+
+    async def run():
+        async with StubGateway(accounts) as gateway:
+            gateway_urls(gateway)
+            gateway.twin_delay = 0.05
+            sessions = []
+
+            def session_factory():
+                sessions.append(aiohttp.ClientSession())
+                return sessions[-1]
+
+            registry = MyFiskerConnectionRegistry(session_factory)
+            apis = [
+                await _logged_in(
+                    username, session=registry.async_get_session("EU", username)
+                )
+                for username in accounts
+            ]
+
+            twins = await asyncio.gather(
+                *(
+                    api.GetDigitalTwin(vin)
+                    for api, vins in zip(apis, accounts.values())
+                    for vin in vins
+                )
+            )
+
+            assert [twin.vin for twin in twins] == [
+                vin for vins in accounts.values() for vin in vins
+            ]
+            assert len(sessions) == 1
+            # One session per account, running side by side
+            assert gateway.connections == len(accounts)
+            assert gateway.peak_open > 1
+
+            # The pool stays open until the last account lets go
+            for username in list(accounts)[:-1]:
+                await registry.async_release("EU", username)
+            assert not sessions[0].closed
+            await registry.async_release("EU", list(accounts)[-1])
+            assert sessions[0].closed
+
+    asyncio.run(run())
+
+
+def test_fleet_polls_through_the_scheduler(gateway_urls):
+    """A fleet of accounts polls over few sessions, commands do not wait for it."""
+    fleet = 120
+    accounts = {
+        f"owner{account:03}": [f"VCF1ZBU27PG{account:06}"] for account in range(fleet)
+    }
+
+    async def run():
+        async with StubGateway(accounts) as gateway:
+            gateway_urls(gateway)
+            gateway.twin_delay = 0.005
+            registry = MyFiskerConnectionRegistry(aiohttp.ClientSession)
+            scheduler = FiskerScheduler()
+            apis = {}
+            for username in accounts:
+                scheduler.async_register(username)
+                apis[username] = await _logged_in(
+                    username, session=registry.async_get_session("EU", username)
+                )
+
+            async def poll(username: str, delay: float, priority: int, order: list):
+                await asyncio.sleep(delay)
+                async with scheduler.session(priority):
+                    order.append(username)
+                    twin = await apis[username].GetDigitalTwin()
+                assert twin.vin == accounts[username][0]
+
+            # Every account polls on a slot of its own within the interval
+            interval = timedelta(seconds=1)
+            now = time.monotonic()
+            polls = {
+                username: scheduler.next_poll(username, interval, now).total_seconds()
+                for username in accounts
+            }
+            slots = sorted(polls.values())
+            assert min(b - a for a, b in zip(slots, slots[1:])) > 0
+
+            order = []
+            await asyncio.gather(
+                *(
+                    poll(username, delay, PRIORITY_IDLE, order)
+                    for username, delay in polls.items()
+                )
+            )
+            assert len(gateway.twin_requests) == fleet
+            assert 0 < gateway.peak_open <= MAX_CONCURRENT_SESSIONS
+
+            # All accounts at once, the driving vehicles were set up last
+            gateway.twin_requests.clear()
+            driving = set(list(accounts)[-fleet // 5 :])
+            order = []
+            tasks = [
+                asyncio.create_task(
+                    poll(
+                        username,
+                        0,
+                        PRIORITY_ACTIVE if username in driving else PRIORITY_IDLE,
+                        order,
+                    )
+                )
+                for username in accounts
+            ]
+            await asyncio.sleep(0.01)
+
+            # A command skips the polls waiting for a session
+            username = next(iter(accounts))
+            result = await apis[username].SendCommandRequest(
+                "doors_lock", vin=accounts[username][0]
+            )
+            assert result.success and result.confirmed
+            assert gateway.commands == ["doors_lock"]
+            assert len(gateway.twin_requests) < fleet // 2
+
+            await asyncio.gather(*tasks)
+            assert len(gateway.twin_requests) == fleet
+            assert gateway.peak_open <= MAX_CONCURRENT_SESSIONS
+
+            # Driving vehicles came before the parked ones still waiting
+            waiting = order[MAX_CONCURRENT_SESSIONS:]
+            assert set(waiting[: len(driving)]) == driving
+
+            for username, api in apis.items():
+                await api.async_close()
+                await registry.async_release("EU", username)
+
+    asyncio.run(run())
@@ -0,0 +1,81 @@
+"""FiskerCommandQueue with a stand-in coordinator."""
+
+import asyncio
+
+from custom_components.my_fisker.api import CommandResult
+from custom_components.my_fisker.commands import FiskerCommandQueue
+
+VIN = "VCF1ZBU27PG000001"
+
+
+class FakeApi:
+    def __init__(self):
+        self.sent: list[str] = []
+
+    async def SendCommandRequest(self, command, command_data="", vin=None):
+        self.sent.append(command)
+        return CommandResult(command, True, confirmed=True)
+
+
+class FakeCoordinator:
+    """Coordinator whose refresh runs until it is let go."""
+
+    vin = VIN
+
+    def __init__(self):
+        self.my_fisker_api = FakeApi()
+        self.refreshes = 0
+        self.refreshing = asyncio.Event()
+        self.finish_refresh = asyncio.Event()
+
+    async def async_request_refresh(self):
+        self.refreshes += 1
+        self.refreshing.set()
+        await self.finish_refresh.wait()
+
+    def async_apply_prediction(self, command):
+        pass
+
+    def async_discard_prediction(self, command):
+        pass
+
+
+def test_command_during_refresh_is_sent():
+    """A press while the drained queue refreshes is not left behind."""
+
+    async def run():
+        coordinator = FakeCoordinator()
+        queue = FiskerCommandQueue(coordinator, debounce=0.01)
+
+        result = await queue.async_submit("doors", "doors_lock")
+        assert result.success
+        await coordinator.refreshing.wait()
+
+        trunk = asyncio.create_task(queue.async_submit("trunk", "trunk_open"))
+        await asyncio.sleep(0.05)
+        coordinator.finish_refresh.set()
+
+        result = await asyncio.wait_for(trunk, 1)
+        assert result.success
+        assert coordinator.my_fisker_api.sent == ["doors_lock", "trunk_open"]
+        assert coordinator.refreshes == 2
+
+    asyncio.run(run())
+
+
+def test_last_command_of_a_group_wins():
+    async def run():
+        coordinator = FakeCoordinator()
+        coordinator.finish_refresh.set()
+        queue = FiskerCommandQueue(coordinator, debounce=0.01)
+
+        lock = asyncio.create_task(queue.async_submit("doors", "doors_lock"))
+        await asyncio.sleep(0)
+        unlock = await queue.async_submit("doors", "doors_unlock")
+
+        assert (await lock).superseded
+        assert unlock.success
+        assert coordinator.my_fisker_api.sent == ["doors_unlock"]
+        assert coordinator.refreshes == 1
+
+    asyncio.run(run())
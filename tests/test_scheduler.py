@@ -0,0 +1,171 @@
+"""FiskerScheduler with a simulated fleet."""
+
+import asyncio
+from collections import Counter
+from datetime import timedelta
+import random
+
+from custom_components.my_fisker.scheduler import (
+    PRIORITY_ACTIVE,
+    PRIORITY_IDLE,
+    FiskerScheduler,
+)
+
+FLEET = 150
+
+
+def test_sessions_capped_for_a_fleet():
+    async def run():
+        scheduler = FiskerScheduler(max_sessions=4)
+        peak = 0
+        served = 0
+
+        async def poll(priority: int):
+            nonlocal peak, served
+            async with scheduler.session(priority):
+                peak = max(peak, scheduler.in_flight)
+                await asyncio.sleep(random.uniform(0, 0.005))
+                served += 1
+
+        await asyncio.gather(
+            *(
+                poll(PRIORITY_ACTIVE if vehicle % 5 == 0 else PRIORITY_IDLE)
+                for vehicle in range(FLEET)
+            )
+        )
+
+        assert served == FLEET
+        assert peak == 4
+        assert scheduler.in_flight == 0
+        assert scheduler._available == 4
+
+    asyncio.run(run())
+
+
+def test_active_vehicles_served_first():
+    async def run():
+        scheduler = FiskerScheduler(max_sessions=1)
+        order = []
+
+        async def poll(name: str, priority: int):
+            async with scheduler.session(priority):
+                order.append(name)
+
+        async with scheduler.session():
+            tasks = [
+                asyncio.create_task(poll(name, priority))
+                for name, priority in (
+                    ("parked 1", PRIORITY_IDLE),
+                    ("driving 1", PRIORITY_ACTIVE),
+                    ("parked 2", PRIORITY_IDLE),
+                    ("driving 2", PRIORITY_ACTIVE),
+                )
+            ]
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+        assert order == ["driving 1", "driving 2", "parked 1", "parked 2"]
+
+    asyncio.run(run())
+
+
+def test_cancelled_waiter_hands_slot_on():
+    """A waiter cancelled right after it was handed the slot passes it on."""
+
+    async def run():
+        scheduler = FiskerScheduler(max_sessions=1)
+        entered = []
+
+        async def poll(name: str):
+            async with scheduler.session():
+                entered.append(name)
+
+        async with scheduler.session():
+            first = asyncio.create_task(poll("first"))
+            second = asyncio.create_task(poll("second"))
+            await asyncio.sleep(0)
+        # The slot went to the first waiter, which is cancelled before it runs
+        first.cancel()
+
+        await asyncio.wait_for(second, 1)
+        assert first.cancelled()
+        assert entered == ["second"]
+        assert scheduler._available == 1
+
+    asyncio.run(run())
+
+
+def test_cancelled_waiter_does_not_take_a_slot():
+    async def run():
+        scheduler = FiskerScheduler(max_sessions=1)
+
+        async def poll():
+            async with scheduler.session():
+                pass
+
+        async with scheduler.session():
+            waiter = asyncio.create_task(poll())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.sleep(0)
+
+        assert waiter.cancelled()
+        assert scheduler._available == 1
+
+    asyncio.run(run())
+
+
+def test_offsets_spread_over_interval():
+    scheduler = FiskerScheduler()
+    interval = timedelta(seconds=20)
+    for account in range(FLEET):
+        scheduler.async_register(f"account {account}")
+
+    offsets = sorted(
+        scheduler.stagger_offset(f"account {account}", interval).total_seconds()
+        for account in range(FLEET)
+    )
+    gaps = [b - a for a, b in zip(offsets, offsets[1:])]
+    gaps.append(offsets[0] + 20 - offsets[-1])
+
+    # Golden-ratio slots leave gaps of at most a few times the even spacing
+    assert min(gaps) > 0
+    assert max(gaps) < 3 * 20 / FLEET
+
+
+def test_polls_stay_on_slot_when_interval_changes():
+    scheduler = FiskerScheduler()
+    for account in range(7):
+        scheduler.async_register(f"account {account}")
+    name = "account 6"
+    now = 1000.0
+
+    for seconds in (20, 20, 60, 60, 900, 5, 20, 20):
+        interval = timedelta(seconds=seconds)
+        offset = scheduler.stagger_offset(name, interval).total_seconds()
+
+        delay = scheduler.next_poll(name, interval, now).total_seconds()
+        poll = now + delay
+
+        assert seconds / 2 <= delay <= 1.5 * seconds
+        assert abs((poll - offset + 1e-6) % seconds) < 1e-3
+
+        # The event loop runs the poll up to a second early or late
+        now = poll + random.uniform(-0.9, 0.9)
+
+
+def test_fleet_polls_spread_over_each_second():
+    scheduler = FiskerScheduler()
+    interval = timedelta(seconds=20)
+    for account in range(FLEET):
+        scheduler.async_register(f"account {account}")
+
+    # Accounts set up at random moments still poll on their own slot
+    polls = Counter()
+    for account in range(FLEET):
+        now = random.uniform(0, 1000)
+        delay = scheduler.next_poll(f"account {account}", interval, now)
+        polls[int(now + delay.total_seconds()) % 20] += 1
+
+    assert len(polls) == 20
+    assert max(polls.values()) <= 2 * FLEET / 20
@@ -0,0 +1,19 @@
+"""TrackCompressor on a long, winding drive."""
+
+import math
+
+from custom_components.my_fisker.const import TRACK_MAX_POINTS, TRACK_TOLERANCE
+from custom_components.my_fisker.track import TrackCompressor
+
+
+def test_track_never_exceeds_max_points():
+    track = TrackCompressor(TRACK_TOLERANCE, TRACK_MAX_POINTS)
+    longest = 0
+
+    # A zig-zag road, every sample bends away from the last kept point
+    for sample in range(20000):
+        track.add(55 + sample * 1e-4, 12 + 0.01 * math.sin(sample / 3))
+        longest = max(longest, len(track.points))
+
+    assert longest == TRACK_MAX_POINTS
+    assert track.points[0] == (55, 12)